@@ -0,0 +1 @@
+"""Benchmarks for the Judo Connectivity Module integration."""
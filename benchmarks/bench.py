@@ -0,0 +1,266 @@
+"""Benchmark the polling path against simulated Judo devices.
+
+Runs the fake REST server in a thread of its own and drives real
+``JudoClient`` and ``JudoDataUpdateCoordinator`` instances against it, one
+per simulated device, on a bare Home Assistant core. For each fleet size it
+reports the refresh latency, the requests each refresh makes, how long the
+event loop was blocked and the memory a device takes.
+
+Run from the repository root, with Home Assistant installed::
+
+    python -m benchmarks.bench --devices 1 10 500 --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import statistics
+import tempfile
+import threading
+import time
+import tracemalloc
+from types import MappingProxyType
+
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntries, ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.judo_connectivity.const import (
+    DEFAULT_MAX_PARALLEL_REQUESTS,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+)
+from custom_components.judo_connectivity.coordinator import (
+    JudoDataUpdateCoordinator,
+)
+from custom_components.judo_connectivity.hub import async_get_hub
+from custom_components.judo_connectivity.judo import JudoClient
+
+from .fake_server import FakeJudoServer, FakeServerConfig, device_url
+
+
+class ServerThread(threading.Thread):
+    """Run a fake server on an event loop of its own."""
+
+    def __init__(self, server: FakeJudoServer) -> None:
+        """Initialize the thread."""
+        super().__init__(daemon=True)
+        self.server = server
+        self.port = 0
+        self._loop = asyncio.new_event_loop()
+        self._listening = threading.Event()
+
+    def run(self) -> None:
+        """Serve until stopped."""
+        asyncio.set_event_loop(self._loop)
+        self.port = self._loop.run_until_complete(self.server.start())
+        self._listening.set()
+        self._loop.run_forever()
+        self._loop.run_until_complete(self.server.stop())
+
+    def start(self) -> None:
+        """Start the thread and wait until the server listens."""
+        super().start()
+        self._listening.wait()
+
+    def stop(self) -> None:
+        """Stop serving and wait for the thread."""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self.join()
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop runs a short periodic sleep."""
+
+    def __init__(self, interval: float = 0.005) -> None:
+        """Initialize the monitor."""
+        self.interval = interval
+        self.lags: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        """Record the overshoot of each sleep."""
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(loop.time() - start - self.interval, 0))
+
+    def __enter__(self) -> LoopLagMonitor:
+        """Start monitoring."""
+        self.lags.clear()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop monitoring."""
+        self._task.cancel()
+
+
+@dataclass(slots=True)
+class FleetResult:
+    """Measurements for one fleet size."""
+
+    devices: int
+    refresh_p50: float
+    refresh_p95: float
+    round_time: float
+    requests_per_refresh: float
+    failed_refreshes: int
+    loop_lag_max: float
+    loop_lag_total: float
+    memory_per_device: float
+
+
+def _make_coordinator(
+    hass: HomeAssistant, session: aiohttp.ClientSession, index: int, port: int
+) -> JudoDataUpdateCoordinator:
+    """Create the client and coordinator of a simulated device."""
+    url = device_url(index)
+    entry = ConfigEntry(
+        data={},
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        minor_version=1,
+        options={},
+        source="user",
+        subentries_data=None,
+        title=f"Judo at {url}:{port}",
+        unique_id=f"{url}:{port}",
+        version=1,
+    )
+    # No read cache, so back to back rounds all reach the server
+    client = JudoClient(url, port, "admin", "admin", session=session, cache_ttl=0)
+    return JudoDataUpdateCoordinator(
+        hass,
+        entry,
+        async_get_hub(hass),
+        client,
+        DEFAULT_UPDATE_INTERVAL,
+        DEFAULT_MAX_PARALLEL_REQUESTS,
+    )
+
+
+async def _timed_refresh(coordinator: JudoDataUpdateCoordinator) -> float:
+    """Refresh every register of a coordinator and return the seconds taken."""
+    coordinator.scheduler.reset()
+    start = time.perf_counter()
+    await coordinator.async_refresh()
+    return time.perf_counter() - start
+
+
+async def bench_fleet(
+    server: FakeJudoServer, port: int, devices: int, rounds: int
+) -> FleetResult:
+    """Measure full refreshes of a fleet of simulated devices."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.config_entries = ConfigEntries(hass, {})
+        await dr.async_load(hass)
+        connector = aiohttp.TCPConnector(limit=0)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            tracemalloc.start()
+            coordinators = [
+                _make_coordinator(hass, session, index, port)
+                for index in range(devices)
+            ]
+            await asyncio.gather(*(c.async_refresh() for c in coordinators))
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            durations: list[float] = []
+            round_times: list[float] = []
+            lags: list[float] = []
+            failed = 0
+            server.reset_counters()
+            for _ in range(rounds):
+                with LoopLagMonitor() as monitor:
+                    start = time.perf_counter()
+                    durations += await asyncio.gather(
+                        *(_timed_refresh(c) for c in coordinators)
+                    )
+                    round_times.append(time.perf_counter() - start)
+                lags += monitor.lags
+                failed += sum(not c.last_update_success for c in coordinators)
+            requests = server.total_requests
+
+            for coordinator in coordinators:
+                await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+
+    quantiles = statistics.quantiles(durations, n=20) if len(durations) > 1 else []
+    return FleetResult(
+        devices=devices,
+        refresh_p50=statistics.median(durations),
+        refresh_p95=quantiles[-1] if quantiles else durations[0],
+        round_time=statistics.median(round_times),
+        requests_per_refresh=requests / len(durations),
+        failed_refreshes=failed,
+        loop_lag_max=max(lags, default=0),
+        loop_lag_total=sum(lags) / rounds,
+        memory_per_device=memory / devices,
+    )
+
+
+def _print_results(results: list[FleetResult]) -> None:
+    """Print the results as a table."""
+    header = (
+        f"{'devices':>8} {'p50 ms':>8} {'p95 ms':>8} {'round ms':>9} "
+        f"{'req/ref':>8} {'failed':>7} {'lag max ms':>11} {'lag/round ms':>13} "
+        f"{'KiB/dev':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        print(
+            f"{result.devices:>8} {result.refresh_p50 * 1000:>8.1f} "
+            f"{result.refresh_p95 * 1000:>8.1f} {result.round_time * 1000:>9.1f} "
+            f"{result.requests_per_refresh:>8.1f} {result.failed_refreshes:>7} "
+            f"{result.loop_lag_max * 1000:>11.2f} "
+            f"{result.loop_lag_total * 1000:>13.2f} "
+            f"{result.memory_per_device / 1024:>8.1f}"
+        )
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run the benchmark for every fleet size."""
+    server = FakeJudoServer(
+        FakeServerConfig(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            max_connections=args.max_connections,
+            seed=args.seed,
+        )
+    )
+    thread = ServerThread(server)
+    thread.start()
+    try:
+        results = [
+            await bench_fleet(server, thread.port, devices, args.rounds)
+            for devices in args.devices
+        ]
+    finally:
+        thread.stop()
+    _print_results(results)
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, nargs="+", default=[1, 10, 500])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--max-connections", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(_async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""Simulated Judo Connectivity Module REST server for benchmarks.
+
+Every loopback address is a separate simulated device, so a single server can
+stand in for a whole fleet: ``http://127.0.0.1``, ``http://127.0.0.2`` and so
+on, all on the same port. Each device answers ``GET /api/rest/<command>``
+with ``{"data": "<hex>"}`` after the configured latency and jitter, fails the
+configured share of requests with HTTP 500 and serves at most
+``max_connections`` requests at a time, like the module's small web server.
+
+It can also push the payloads of a device to the integration's push webhook,
+as a gateway script mirroring the module would.
+
+Run it standalone with ``python -m benchmarks.fake_server --help``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+import ipaddress
+import json
+import random
+import struct
+
+import aiohttp
+from aiohttp import web
+
+# Payloads of the examples in the REST API command reference
+DEFAULT_PAYLOADS = {
+    "FF00": "47",
+    "0600": "64d90100",
+    "0100": "6b1502",
+    "2500": "060c7500",
+    "2900": "2edc0000",
+    "5600": "f6541100",
+    "5100": "0600",
+}
+# Polled registers, pushed when pushing
+PUSH_COMMANDS = ("2900", "5600", "2500", "5100")
+
+
+@dataclass(slots=True)
+class FakeServerConfig:
+    """Behaviour of the simulated devices."""
+
+    latency: float = 0.05  # Seconds per request
+    jitter: float = 0.02  # Seconds, uniformly added to the latency
+    error_rate: float = 0.0  # Share of requests answered with HTTP 500
+    max_connections: int = 2  # Requests served at a time per device
+    payloads: dict[str, str] = field(default_factory=DEFAULT_PAYLOADS.copy)
+    water_per_request: int = 1  # Liters the 2900 counter grows per read
+    seed: int | None = None
+
+
+class FakeJudoServer:
+    """aiohttp application simulating any number of Judo devices."""
+
+    def __init__(self, config: FakeServerConfig) -> None:
+        """Initialize the server."""
+        self.config = config
+        self.requests: Counter[str] = Counter()  # Per command
+        self.errors = 0
+        self.bytes_sent = 0
+        self._random = random.Random(config.seed)
+        self._limits: dict[str, asyncio.Semaphore] = {}
+        self._water: Counter[str] = Counter()
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def total_requests(self) -> int:
+        """Return the number of requests answered so far."""
+        return sum(self.requests.values())
+
+    def reset_counters(self) -> None:
+        """Reset the request, error and byte counters."""
+        self.requests.clear()
+        self.errors = 0
+        self.bytes_sent = 0
+
+    def _payload(self, device: str, command: str) -> str | None:
+        """Return the hex payload of a command for a device."""
+        if command == "0600":
+            # A distinct device number per simulated device
+            number = int(ipaddress.ip_address(device)) & 0xFFFFFF
+            return struct.pack("<I", number).hex()
+        if command == "2900":
+            self._water[device] += self.config.water_per_request
+            base = struct.unpack("<I", bytes.fromhex(self.config.payloads["2900"]))[0]
+            return struct.pack("<I", base + self._water[device]).hex()
+        if command in self.config.payloads:
+            return self.config.payloads[command]
+        if command[:2] in ("FB", "FC", "FD", "FE"):
+            # History blocks: 31 days of 100 liters, MSB first
+            return (100).to_bytes(4, "big").hex() * 31
+        return None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        """Answer a REST command."""
+        device = request.transport.get_extra_info("sockname")[0]
+        command = request.match_info["command"].upper()
+        limit = self._limits.setdefault(
+            device, asyncio.Semaphore(self.config.max_connections)
+        )
+        async with limit:
+            await asyncio.sleep(
+                self.config.latency + self._random.uniform(0, self.config.jitter)
+            )
+            self.requests[command[:4]] += 1
+            if self._random.random() < self.config.error_rate:
+                self.errors += 1
+                return web.Response(status=500)
+            if (payload := self._payload(device, command)) is None:
+                return web.Response(status=404)
+            body = json.dumps({"data": payload})
+            self.bytes_sent += len(body)
+            return web.Response(text=body, content_type="application/json")
+
+    async def push(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        device: str = "127.0.0.1",
+        commands: Iterable[str] = PUSH_COMMANDS,
+    ) -> int:
+        """Push the payloads of a device to a webhook and return the HTTP status."""
+        body = [
+            {"command": command, "data": self._payload(device, command)}
+            for command in commands
+        ]
+        async with session.post(url, json=body) as response:
+            return response.status
+
+    def make_app(self) -> web.Application:
+        """Return the aiohttp application."""
+        app = web.Application()
+        app.router.add_get("/api/rest/{command}", self._handle)
+        return app
+
+    async def start(self, host: str = "0.0.0.0", port: int = 0) -> int:
+        """Start serving and return the bound port."""
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        return self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+def device_url(index: int) -> str:
+    """Return the base URL of the simulated device with the given index."""
+    return f"http://127.0.{index // 250}.{index % 250 + 1}"
+
+
+async def _async_serve(
+    server: FakeJudoServer, port: int, push_url: str | None, push_interval: float
+) -> None:
+    """Serve, pushing the first device's payloads to ``push_url`` if set."""
+    await server.start(port=port)
+    try:
+        if push_url is None:
+            await asyncio.Event().wait()
+        async with aiohttp.ClientSession() as session:
+            while True:
+                try:
+                    status = await server.push(session, push_url)
+                except aiohttp.ClientError as err:
+                    print(f"Push failed: {err}")
+                else:
+                    print(f"Pushed {', '.join(PUSH_COMMANDS)}: HTTP {status}")
+                await asyncio.sleep(push_interval)
+    finally:
+        await server.stop()
+
+
+def _main() -> None:
+    """Run the fake server until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--max-connections", type=int, default=2)
+    parser.add_argument(
+        "--payloads", help="JSON file mapping commands to hex payloads"
+    )
+    parser.add_argument(
+        "--push-url", help="push webhook URL to push the payloads of 127.0.0.1 to"
+    )
+    parser.add_argument("--push-interval", type=float, default=10.0)
+    args = parser.parse_args()
+    config = FakeServerConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        max_connections=args.max_connections,
+    )
+    if args.payloads:
+        with open(args.payloads, encoding="utf-8") as file:
+            config.payloads.update(json.load(file))
+    server = FakeJudoServer(config)
+    try:
+        asyncio.run(
+            _async_serve(server, args.port, args.push_url, args.push_interval)
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    _main()
@@ -5,39 +5,114 @@ from __future__ import annotations
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    CONF_WEBHOOK_ID,
+    Platform,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers import device_registry as dr
-
-from .const import CONF_PORT, CONF_UPDATE_INTERVAL, CONF_URL, DOMAIN
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_MAX_PARALLEL_REQUESTS,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_PORT,
+    CONF_PROFILING,
+    CONF_PUSH_UPDATES,
+    CONF_STALENESS_BUDGET,
+    CONF_UPDATE_INTERVAL,
+    CONF_URL,
+    DEFAULT_MAX_PARALLEL_REQUESTS,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_STALENESS_BUDGET,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    STORAGE_VERSION,
+)
 from .coordinator import JudoDataUpdateCoordinator
+from .hub import async_get_hub
 from .judo import JudoClient
+from .profiler import JudoProfiler
+from .push import async_setup_push
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.BUTTON, Platform.NUMBER, Platform.SENSOR]
+PLATFORMS: list[Platform] = [
+    Platform.BINARY_SENSOR,
+    Platform.BUTTON,
+    Platform.EVENT,
+    Platform.NUMBER,
+    Platform.SENSOR,
+]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 type JudoConfigEntry = ConfigEntry[JudoDataUpdateCoordinator]
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Judo Connectivity Module services."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: JudoConfigEntry) -> bool:
     """Set up Judo Connectivity Module from a config entry."""
     url = entry.data[CONF_URL]
     port = entry.data[CONF_PORT]
     username = entry.data[CONF_USERNAME]
     password = entry.data[CONF_PASSWORD]
-    update_interval = entry.options.get(CONF_UPDATE_INTERVAL, 300)  # Default 5 min
+    update_interval = entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+    max_parallel_requests = entry.options.get(
+        CONF_MAX_PARALLEL_REQUESTS, DEFAULT_MAX_PARALLEL_REQUESTS
+    )
+    adaptive_bounds = None
+    if entry.options.get(CONF_ADAPTIVE_POLLING, False):
+        adaptive_bounds = (
+            entry.options.get(CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL),
+            entry.options.get(CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL),
+        )
 
     # 1. Create API instance
-    client = JudoClient(url, port, username, password)
-    coordinator = JudoDataUpdateCoordinator(hass, client, update_interval)
+    client = JudoClient(
+        url, port, username, password, session=async_get_clientsession(hass)
+    )
+    coordinator = JudoDataUpdateCoordinator(
+        hass,
+        entry,
+        async_get_hub(hass),
+        client,
+        update_interval,
+        max_parallel_requests,
+        adaptive_bounds,
+        entry.options.get(CONF_STALENESS_BUDGET, DEFAULT_STALENESS_BUDGET),
+        JudoProfiler() if entry.options.get(CONF_PROFILING, False) else None,
+    )
 
-    # 2. Validate the API connection
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        raise ConfigEntryNotReady(f"Failed to connect to Judo device: {err}") from err
+    # 2. Start from the cached snapshot and refresh in the background, or
+    # validate the API connection when there is none
+    if await coordinator.async_restore():
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} refresh {entry.title}"
+        )
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception as err:
+            await client.async_close()
+            coordinator.hub.async_skip_module(entry.entry_id)
+            raise ConfigEntryNotReady(
+                f"Failed to connect to Judo device: {err}"
+            ) from err
 
     # 3. Store coordinator in runtime data
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
@@ -50,17 +125,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: JudoConfigEntry) -> bool
         identifiers={(DOMAIN, f"{url}:{port}")},
         manufacturer="Judo",
         name="Judo Connectivity Module",
-        model=coordinator.data["device_type"],
-        sw_version=coordinator.data["sw_version"],
+        model=coordinator.data.device_type,
+        sw_version=coordinator.data.sw_version,
     )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(coordinator.hub.async_add_coordinator(coordinator))
+    if entry.options.get(CONF_PUSH_UPDATES, False):
+        entry.async_on_unload(
+            async_setup_push(
+                hass, entry, coordinator, entry.options[CONF_WEBHOOK_ID]
+            )
+        )
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: JudoConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: JudoConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    if unload_ok and entry.entry_id in hass.data[DOMAIN]:
-        hass.data[DOMAIN].pop(entry.entry_id)
+    if unload_ok:
+        await entry.runtime_data.client.async_close()
+        if entry.entry_id in hass.data[DOMAIN]:
+            hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: JudoConfigEntry) -> None:
+    """Remove the cached snapshot and fleet share of a deleted config entry."""
+    async_get_hub(hass).async_remove_module(entry.entry_id)
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
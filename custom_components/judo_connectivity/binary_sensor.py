@@ -0,0 +1,67 @@
+"""Binary sensor entities for Judo Connectivity Module."""
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .coordinator import JudoDataUpdateCoordinator
+from .entity import JudoEntity
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the binary sensor platform."""
+    coordinator: JudoDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([JudoWaterLeakBinarySensor(coordinator, entry)])
+
+
+class JudoWaterLeakBinarySensor(JudoEntity, BinarySensorEntity):
+    """Representation of the leak detected from the water counter."""
+
+    _attr_name = "Water Leak"
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_icon = "mdi:pipe-leak"
+
+    def __init__(
+        self, coordinator: JudoDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.unique_id}_water_leak"
+        self._written_alert: str | None = None
+
+    def _data_changed(self) -> bool:
+        """Return if the leak alert changed since the last update."""
+        alert = self.coordinator.leak_detector.alert
+        if alert == self._written_alert:
+            return False
+        self._written_alert = alert
+        return True
+
+    @property
+    def available(self) -> bool:
+        """Return if the water counter is current enough to judge."""
+        return self.coordinator.is_fresh("water_counter")
+
+    @property
+    def is_on(self) -> bool:
+        """Return if a leak is suspected."""
+        return self.coordinator.leak_detector.alert is not None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any]:
+        """Return the kind of leak and the flow statistics it is judged by."""
+        detector = self.coordinator.leak_detector
+        return {
+            "alert": detector.alert,
+            "mean_flow_rate": round(detector.mean, 2),
+            "flow_rate_stdev": round(detector.stdev, 2),
+        }
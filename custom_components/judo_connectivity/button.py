@@ -4,11 +4,12 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import JudoDataUpdateCoordinator
+from .entity import JudoEntity
+from .judo import JudoError
 
 
 async def async_setup_entry(
@@ -21,7 +22,7 @@ async def async_setup_entry(
     async_add_entities([JudoSaltRefillTriggerButton(coordinator, entry)])
 
 
-class JudoSaltRefillTriggerButton(ButtonEntity):
+class JudoSaltRefillTriggerButton(JudoEntity, ButtonEntity):
     """Representation of the Regeneration Salt Refill Trigger button."""
 
     _attr_name = "Regeneration Salt Trigger Refill"
@@ -31,31 +32,13 @@ class JudoSaltRefillTriggerButton(ButtonEntity):
         self, coordinator: JudoDataUpdateCoordinator, entry: ConfigEntry
     ) -> None:
         """Initialize the button."""
-        self.coordinator = coordinator
-        self._entry = entry
-        self._attr_has_entity_name = True
+        super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.unique_id}_salt_refill_trigger"
 
-    @property
-    def device_info(self) -> DeviceInfo | None:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.unique_id)},
-        )
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
-
     async def async_press(self) -> None:
-        """Handle the button press."""
-        # Get the refill mass from the number entity
-        mass_kg = self.hass.states.get(
-            f"number.{self._entry.unique_id}_regeneration_salt_refill_mass"
-        )
-        if mass_kg is None:
-            raise HomeAssistantError("Refill mass not set")
-        mass_grams = int(float(mass_kg.state) * 1000)
-        await self.coordinator.client.async_set_salt_refill(mass_grams)
-        await self.coordinator.async_request_refresh()
+        """Write the refill mass set on the number entity."""
+        mass_grams = round(self.coordinator.salt_refill_mass * 1000)
+        try:
+            await self.coordinator.async_set_salt_refill(mass_grams)
+        except JudoError as err:
+            raise HomeAssistantError(f"Could not set the salt refill: {err}") from err
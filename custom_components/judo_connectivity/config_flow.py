@@ -1,14 +1,33 @@
 """Config flow for Judo Connectivity Module integration."""
 
-import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.components import webhook
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, CONF_WEBHOOK_ID
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import CONF_PORT, CONF_UPDATE_INTERVAL, CONF_URL, DOMAIN
-from .judo import JudoClient
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_MAX_PARALLEL_REQUESTS,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_PORT,
+    CONF_PROFILING,
+    CONF_PUSH_UPDATES,
+    CONF_STALENESS_BUDGET,
+    CONF_UPDATE_INTERVAL,
+    CONF_URL,
+    DEFAULT_MAX_PARALLEL_REQUESTS,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_STALENESS_BUDGET,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+)
+from .judo import JudoAuthenticationError, JudoClient, JudoConnectionError
 
 
 class JudoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -16,6 +35,14 @@ class JudoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Return the options flow handler."""
+        return JudoOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, any] | None = None
     ) -> FlowResult:
@@ -28,10 +55,13 @@ class JudoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 user_input[CONF_PORT],
                 user_input[CONF_USERNAME],
                 user_input[CONF_PASSWORD],
+                session=async_get_clientsession(self.hass),
             )
             try:
                 await client.async_fetch_data("FF00")  # Test with device type
-            except aiohttp.ClientError:
+            except JudoAuthenticationError:
+                errors["base"] = "invalid_auth"
+            except JudoConnectionError:
                 errors["base"] = "cannot_connect"
             else:
                 # Ensure unique entry
@@ -58,7 +88,9 @@ class JudoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_USERNAME, description={"suggested_value": "admin"}
                     ): str,
                     vol.Required(CONF_PASSWORD): str,
-                    vol.Required(CONF_UPDATE_INTERVAL, default=300): int,
+                    vol.Required(
+                        CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL
+                    ): int,
                 }
             ),
             errors=errors,
@@ -67,3 +99,76 @@ class JudoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_import(self, import_info: dict[str, any]) -> FlowResult:
         """Handle import from configuration.yaml (not implemented)."""
         return await self.async_step_user(import_info)
+
+
+class JudoOptionsFlow(config_entries.OptionsFlow):
+    """Handle options for Judo Connectivity Module."""
+
+    async def async_step_init(
+        self, user_input: dict[str, any] | None = None
+    ) -> FlowResult:
+        """Manage the polling options."""
+        errors = {}
+        if user_input is not None:
+            minimum = user_input[CONF_MIN_UPDATE_INTERVAL]
+            if minimum > user_input[CONF_MAX_UPDATE_INTERVAL]:
+                errors["base"] = "invalid_interval_bounds"
+            else:
+                webhook_id = self.config_entry.options.get(CONF_WEBHOOK_ID)
+                if user_input[CONF_PUSH_UPDATES] and webhook_id is None:
+                    webhook_id = webhook.async_generate_id()
+                if webhook_id is not None:
+                    user_input[CONF_WEBHOOK_ID] = webhook_id
+                return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_UPDATE_INTERVAL,
+                        default=options.get(
+                            CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
+                        ),
+                    ): vol.All(int, vol.Range(min=5)),
+                    vol.Required(
+                        CONF_MAX_PARALLEL_REQUESTS,
+                        default=options.get(
+                            CONF_MAX_PARALLEL_REQUESTS, DEFAULT_MAX_PARALLEL_REQUESTS
+                        ),
+                    ): vol.All(int, vol.Range(min=1, max=7)),
+                    vol.Required(
+                        CONF_ADAPTIVE_POLLING,
+                        default=options.get(CONF_ADAPTIVE_POLLING, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_MIN_UPDATE_INTERVAL,
+                        default=options.get(
+                            CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL
+                        ),
+                    ): vol.All(int, vol.Range(min=5)),
+                    vol.Required(
+                        CONF_MAX_UPDATE_INTERVAL,
+                        default=options.get(
+                            CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL
+                        ),
+                    ): vol.All(int, vol.Range(min=5)),
+                    vol.Required(
+                        CONF_STALENESS_BUDGET,
+                        default=options.get(
+                            CONF_STALENESS_BUDGET, DEFAULT_STALENESS_BUDGET
+                        ),
+                    ): vol.All(int, vol.Range(min=0)),
+                    vol.Required(
+                        CONF_PUSH_UPDATES,
+                        default=options.get(CONF_PUSH_UPDATES, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_PROFILING,
+                        default=options.get(CONF_PROFILING, False),
+                    ): bool,
+                }
+            ),
+            errors=errors,
+        )
@@ -5,6 +5,48 @@ DOMAIN = "judo_connectivity"
 CONF_URL = "url"
 CONF_PORT = "port"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_MAX_PARALLEL_REQUESTS = "max_parallel_requests"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
+CONF_STALENESS_BUDGET = "staleness_budget"
+CONF_PUSH_UPDATES = "push_updates"
+CONF_PROFILING = "profiling"
+
+DEFAULT_UPDATE_INTERVAL = 300
+DEFAULT_MAX_PARALLEL_REQUESTS = 2
+DEFAULT_MIN_UPDATE_INTERVAL = 10
+DEFAULT_MAX_UPDATE_INTERVAL = 3600
+DEFAULT_STALENESS_BUDGET = 600
+DEFAULT_SALT_REFILL_MASS = 5.0  # Kilograms
+
+# Fields whose changes show the softener is in use, for adaptive polling
+ACTIVITY_FIELDS = frozenset({"total_water_volume", "salt_stock"})
+
+# Storage of the last snapshot, so entities can start from cache
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30
+
+# Water consumption time series
+WATER_SERIES_CAPACITY = 4096
+FLOW_RATE_WINDOW = 300
+
+# Leak detection: seconds of uninterrupted flow, the shortest pause in seconds
+# that interrupts it, and how far above the mean flow rate a burst lies, once
+# enough flowing readings have been seen
+LEAK_CONTINUOUS_FLOW = 7200
+LEAK_MIN_PAUSE = 1800
+LEAK_BURST_SIGMA = 4.0
+LEAK_MIN_SAMPLES = 30
+
+# Salt forecast: regenerations the salt and water rates are taken over
+SALT_FORECAST_REGENERATIONS = 5
+
+# Requests in flight across all modules of the instance
+HUB_MAX_PARALLEL_REQUESTS = 8
+
+# Salt range in days at or below which a module counts as needing a refill
+FLEET_REFILL_DAYS = 14
 
 DEVICE_TYPES = {
     0x34: "SOFTwell P",
@@ -1,46 +1,551 @@
 """Data update coordinator for Judo Connectivity Module."""
 
-from datetime import timedelta
+import asyncio
+from collections.abc import Iterable, Mapping, Set
+from dataclasses import asdict, dataclass, fields, replace
 import logging
+import time
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .judo import JudoClient
+from .const import (
+    ACTIVITY_FIELDS,
+    DEFAULT_SALT_REFILL_MASS,
+    DEFAULT_STALENESS_BUDGET,
+    DOMAIN,
+    LEAK_BURST_SIGMA,
+    LEAK_CONTINUOUS_FLOW,
+    LEAK_MIN_PAUSE,
+    LEAK_MIN_SAMPLES,
+    SALT_FORECAST_REGENERATIONS,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    WATER_SERIES_CAPACITY,
+)
+from .forecast import JudoSaltForecast
+from .hub import JudoHub
+from .judo import JudoClient, JudoError
+from .leak import JudoLeakDetector
+from .profiler import JudoProfiler
+from .registers import (
+    COMMAND_REGISTERS,
+    FIELD_REGISTERS,
+    IDENTITY_REGISTERS,
+    POLLED_REGISTERS,
+    JudoRegister,
+)
+from .scheduler import JudoPollScheduler
+from .timeseries import JudoWaterSeries
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class JudoDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Judo data."""
+@dataclass(frozen=True, slots=True)
+class JudoData:
+    """Decoded snapshot of a Judo device, one attribute per register field."""
+
+    device_type: str | None = None
+    device_no: int | None = None
+    sw_version: str | None = None
+    operating_hours: float | None = None
+    water_counter: int | None = None
+    total_water_volume: float | None = None
+    salt_stock: int | None = None
+    salt_range: int | None = None
+    water_hardness: int | None = None
+
+
+_DATA_FIELDS = tuple(field.name for field in fields(JudoData))
+_IDENTITY_FIELDS = frozenset(
+    field.key for register in IDENTITY_REGISTERS for field in register.fields
+)
+
+
+def _changed_fields(old: JudoData | None, new: JudoData) -> frozenset[str]:
+    """Return the names of the fields that differ between two snapshots."""
+    if old is None:
+        return frozenset(_DATA_FIELDS)
+    return frozenset(
+        name for name in _DATA_FIELDS if getattr(old, name) != getattr(new, name)
+    )
+
+
+class JudoDataUpdateCoordinator(DataUpdateCoordinator[JudoData]):
+    """Class to manage fetching Judo data.
+
+    The coordinator has no timer of its own; the hub triggers a refresh
+    whenever its next register is due.
+    """
+
+    config_entry: ConfigEntry
 
     def __init__(
-        self, hass: HomeAssistant, client: JudoClient, update_interval: int
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        hub: JudoHub,
+        client: JudoClient,
+        update_interval: int,
+        max_parallel_requests: int,
+        adaptive_bounds: tuple[int, int] | None = None,
+        staleness_budget: int = DEFAULT_STALENESS_BUDGET,
+        profiler: JudoProfiler | None = None,
     ) -> None:
-        """Initialize the coordinator."""
+        """Initialize the coordinator.
+
+        With ``adaptive_bounds`` set to ``(minimum, maximum)`` seconds, the
+        update interval tightens to the minimum while the softener is in use
+        and doubles up to the maximum while it is idle.
+
+        A field whose register could not be read keeps its last known value
+        until it is ``staleness_budget`` seconds overdue.
+
+        With a ``profiler``, the refresh path and the client calls are timed.
+        """
+        self.hub = hub
         self.client = client
+        self.identity: dict[str, any] = {}
+        self._identity_restored = False
+        self.changed_fields: frozenset[str] = frozenset()
+        self.updated_at: dict[str, float] = {}
+        self.staleness_budget = staleness_budget
+        self.refresh_duration: float | None = None  # Seconds, last refresh
+        self.salt_refill_mass = DEFAULT_SALT_REFILL_MASS  # Kilograms
+        self.water_series = JudoWaterSeries(WATER_SERIES_CAPACITY)
+        self.leak_detector = JudoLeakDetector(
+            LEAK_CONTINUOUS_FLOW, LEAK_MIN_PAUSE, LEAK_BURST_SIGMA, LEAK_MIN_SAMPLES
+        )
+        self.leak_alert: str | None = None  # Raised by the update being handled
+        self.salt_forecast = JudoSaltForecast(SALT_FORECAST_REGENERATIONS)
+        self.store: Store[dict[str, any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}"
+        )
+        self.adaptive_bounds = adaptive_bounds
+        if adaptive_bounds is not None:
+            minimum, maximum = adaptive_bounds
+            update_interval = min(max(update_interval, minimum), maximum)
+        self.scheduler = JudoPollScheduler(POLLED_REGISTERS, update_interval)
+        self._request_limit = asyncio.Semaphore(max_parallel_requests)
+        self._stale_check_job = HassJob(
+            self._async_stale_check, cancel_on_shutdown=True
+        )
+        self._unsub_stale_check: CALLBACK_TYPE | None = None
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=entry,
             name="Judo Connectivity Module",
-            update_interval=timedelta(seconds=update_interval),
         )
+        self.profiler = profiler
+        if profiler is not None:
+            profiler.instrument(
+                self,
+                (
+                    "_async_update_data",
+                    "_async_fetch",
+                    "_merge_values",
+                    "_apply_values",
+                    "async_set_updated_data",
+                ),
+            )
+            profiler.instrument(client, ("async_fetch_payload", "_async_get"))
+
+    async def async_restore(self) -> bool:
+        """Restore identity and the last snapshot from storage.
+
+        Returns whether a snapshot was restored. Its values count as fresh as
+        of when they were read, so entities show them until they go stale.
+        """
+        if not (stored := await self.store.async_load()):
+            return False
+        self.identity = stored["identity"]
+        self._identity_restored = True
+        offset = time.monotonic() - time.time()
+        self.updated_at = {
+            key: timestamp + offset
+            for key, timestamp in stored["updated_at"].items()
+            if key in FIELD_REGISTERS
+        }
+        if "water_series" in stored:
+            self.water_series.restore(stored["water_series"])
+        if "leak_detector" in stored:
+            self.leak_detector.restore(stored["leak_detector"])
+        if "salt_forecast" in stored:
+            self.salt_forecast.restore(stored["salt_forecast"])
+        self.async_set_updated_data(
+            JudoData(
+                **{
+                    key: value
+                    for key, value in stored["data"].items()
+                    if key in _DATA_FIELDS
+                }
+            )
+        )
+        return True
+
+    @callback
+    def _data_to_store(self) -> dict[str, any]:
+        """Return the identity and snapshot to persist."""
+        offset = time.time() - time.monotonic()
+        return {
+            "identity": self.identity,
+            "data": asdict(self.data),
+            "updated_at": {
+                key: updated_at + offset
+                for key, updated_at in self.updated_at.items()
+            },
+            "water_series": self.water_series.as_dict(),
+            "leak_detector": self.leak_detector.as_dict(),
+            "salt_forecast": self.salt_forecast.as_dict(),
+        }
+
+    async def async_shutdown(self) -> None:
+        """Persist the latest snapshot when the entry is unloaded."""
+        await super().async_shutdown()
+        if self._unsub_stale_check is not None:
+            self._unsub_stale_check()
+            self._unsub_stale_check = None
+        if self.data is not None:
+            await self.store.async_save(self._data_to_store())
+
+    @property
+    def poll_interval(self) -> float:
+        """Return the shortest seconds between two scheduled refreshes."""
+        return self.scheduler.tick_interval
+
+    def next_poll_delay(self) -> float:
+        """Return the seconds until the next register is due."""
+        now = time.monotonic()
+        return self.scheduler.next_due(now) - now
+
+    async def async_fetch_payload(self, command: str) -> bytes:
+        """Fetch the payload of a command, respecting the in-flight request caps."""
+        async with self._request_limit, self.hub.request_limit:
+            return await self.client.async_fetch_payload(command)
+
+    async def _async_fetch(self, register: JudoRegister) -> dict[str, any]:
+        """Fetch and decode a register."""
+        return register.decode(await self.async_fetch_payload(register.command))
+
+    async def _async_fetch_registers(
+        self, registers: Iterable[JudoRegister]
+    ) -> dict[JudoRegister, dict[str, any] | None]:
+        """Fetch registers concurrently, in the given order.
+
+        A failed register maps to None; an error is raised when every
+        register fails.
+        """
+        registers = list(registers)
+        results = await asyncio.gather(
+            *(self._async_fetch(register) for register in registers),
+            return_exceptions=True,
+        )
+        values = {}
+        errors = []
+        for register, result in zip(registers, results, strict=True):
+            if isinstance(result, BaseException):
+                _LOGGER.debug("Command %s failed: %s", register.command, result)
+                errors.append(result)
+                result = None
+            values[register] = result
+        if errors and len(errors) == len(registers):
+            raise UpdateFailed(f"Error communicating with Judo device: {errors[0]}")
+        return values
+
+    @staticmethod
+    def _merge_values(
+        values: dict[JudoRegister, dict[str, any] | None],
+    ) -> dict[str, any]:
+        """Merge the successfully decoded registers into one dict."""
+        data = {}
+        for decoded in values.values():
+            if decoded is not None:
+                data.update(decoded)
+        return data
+
+    def overdue(self) -> float:
+        """Return how many seconds the most overdue field is past its interval."""
+        now = time.monotonic()
+        return max(
+            [
+                0.0,
+                *(
+                    now - updated_at - self.scheduler.interval(FIELD_REGISTERS[key])
+                    for key, updated_at in self.updated_at.items()
+                ),
+            ]
+        )
+
+    def is_fresh(self, key: str) -> bool:
+        """Return if a field has a value that is not overdue past the budget."""
+        if getattr(self.data, key) is None:
+            return False
+        register = FIELD_REGISTERS[key]
+        if register.identity:
+            return True
+        if (updated_at := self.updated_at.get(key)) is None:
+            return False
+        overdue = time.monotonic() - updated_at - self.scheduler.interval(register)
+        return overdue <= self.staleness_budget
+
+    async def _async_setup(self) -> None:
+        """Fetch the static device identity once before the first refresh."""
+        self.identity = self._merge_values(
+            await self._async_fetch_registers(IDENTITY_REGISTERS)
+        )
+
+    async def _async_refresh_identity(self) -> None:
+        """Re-read the device identity and update the device on firmware changes."""
+        try:
+            values = await self._async_fetch_registers(IDENTITY_REGISTERS)
+        except UpdateFailed:
+            return
+        identity = {**self.identity, **self._merge_values(values)}
+        if identity.get("sw_version") != self.identity.get("sw_version"):
+            _LOGGER.info(
+                "Judo device firmware changed from %s to %s",
+                self.identity.get("sw_version"),
+                identity.get("sw_version"),
+            )
+            device_registry = dr.async_get(self.hass)
+            if device := device_registry.async_get_device(
+                identifiers={(DOMAIN, self.config_entry.unique_id)}
+            ):
+                device_registry.async_update_device(
+                    device.id, sw_version=identity.get("sw_version")
+                )
+        self.identity = identity
+
+    async def _async_update_data(self) -> JudoData:
+        """Fetch data from Judo device, timing the refresh."""
+        start = time.perf_counter()
+        try:
+            return await self._async_poll()
+        finally:
+            self.refresh_duration = time.perf_counter() - start
+
+    async def _async_poll(self) -> JudoData:
+        """Poll the registers that are due.
+
+        Only the volatile registers that are due are polled. The others, and
+        those that failed, keep their last known value. The cached identity
+        is re-read while incomplete, once after it was restored from storage
+        and when the module comes back after a failed refresh, since that is
+        when a firmware update would happen.
+        """
+        # Nothing changed when the refresh fails, listeners may still be called
+        self.changed_fields = frozenset()
+        if (
+            self._identity_restored
+            or not self.last_update_success
+            or self.identity.keys() < _IDENTITY_FIELDS
+        ):
+            self._identity_restored = False
+            await self._async_refresh_identity()
+        now = time.monotonic()
+        values = await self._async_fetch_registers(self.scheduler.due(now))
+        polled = self._merge_values(values)
+        data = self._apply_values(polled, now)
+        self.changed_fields = _changed_fields(self.data, data)
+        if self.adaptive_bounds is not None and self.data is not None:
+            self._adapt_interval(polled.keys())
+        for register, decoded in values.items():
+            if decoded is not None:
+                self.scheduler.mark_polled(register, now)
+        return data
+
+    @callback
+    def async_push(self, payloads: Mapping[str, bytes]) -> None:
+        """Apply register payloads pushed by the module.
+
+        A pushed register counts as polled, so it is only polled again once
+        pushes for it stop for longer than its interval.
+        """
+        values = {}
+        for command, payload in payloads.items():
+            register = COMMAND_REGISTERS[command]
+            values[register] = register.decode(payload)
+        self._async_apply_registers(values)
+
+    @callback
+    def _async_apply_registers(
+        self, values: dict[JudoRegister, dict[str, any]]
+    ) -> None:
+        """Apply registers read outside a refresh and mark them polled."""
+        now = time.monotonic()
+        for register in values:
+            self.scheduler.mark_polled(register, now)
+        self.hub.async_reschedule(self)
+        self.async_set_updated_data(
+            self._apply_values(self._merge_values(values), now)
+        )
+
+    async def async_set_salt_refill(self, mass_grams: int) -> None:
+        """Write the salt refill mass and show it before the module confirms it.
 
-    async def _async_update_data(self) -> dict[str, any]:
-        """Fetch data from Judo device."""
+        The new stock is applied right away. Once written, only its register
+        is read back; the value read replaces the optimistic one, and the old
+        stock comes back when the write or the read fails. The salt forecast
+        takes the written stock as a refill, not as salt used.
+        """
+        register = COMMAND_REGISTERS["5600"]
+        optimistic = {"salt_stock": mass_grams}
+        previous = {key: getattr(self.data, key) for key in optimistic}
+        self._async_set_local_data(replace(self.data, **optimistic))
         try:
-            data = {}
-            data["device_type"] = await self.client.async_fetch_data("FF00")
-            data["device_no"] = await self.client.async_fetch_data("0600")
-            data["sw_version"] = await self.client.async_fetch_data("0100")
-            data["operating_hours"] = await self.client.async_fetch_data("2500")
-            data["total_water_volume"] = await self.client.async_fetch_data("2900")  # Updated to 2900
-            salt_data = await self.client.async_fetch_data("5600")
-            data["salt_range"] = salt_data
-            data["salt_stock"] = salt_data
-            data["water_hardness"] = await self.client.async_fetch_data("5100")
-            return data
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with Judo device: {err}") from err
+            await self.client.async_set_salt_refill(mass_grams)
+        except JudoError:
+            self._async_roll_back(previous, optimistic)
+            raise
+        self.salt_forecast.rebase(mass_grams)
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_verify_write(register, previous, optimistic),
+            f"{DOMAIN} verify {register.command}",
+        )
+
+    async def _async_verify_write(
+        self,
+        register: JudoRegister,
+        previous: dict[str, any],
+        optimistic: dict[str, any],
+    ) -> None:
+        """Read back a written register, rolling back if that fails."""
+        try:
+            decoded = await self._async_fetch(register)
+        except JudoError as err:
+            _LOGGER.debug("Verifying write of %s failed: %s", register.command, err)
+            self._async_roll_back(previous, optimistic)
+            return
+        if any(decoded[key] != value for key, value in optimistic.items()):
+            _LOGGER.debug(
+                "Command %s read back %s after writing %s",
+                register.command,
+                decoded,
+                optimistic,
+            )
+        self._async_apply_registers({register: decoded})
+
+    @callback
+    def _async_set_local_data(self, data: JudoData) -> None:
+        """Show a snapshot changed locally, not read from the module.
+
+        Unlike ``async_set_updated_data``, it does not mark the last refresh
+        as successful, so an outage stays visible.
+        """
+        self.changed_fields = _changed_fields(self.data, data)
+        self.data = data
+        self.async_update_listeners()
+
+    @callback
+    def _async_roll_back(
+        self, previous: dict[str, any], optimistic: dict[str, any]
+    ) -> None:
+        """Restore the fields of a failed write that nothing has replaced."""
+        restore = {
+            key: value
+            for key, value in previous.items()
+            if getattr(self.data, key) == optimistic[key]
+        }
+        if restore:
+            self._async_set_local_data(replace(self.data, **restore))
+
+    def _apply_values(self, polled: dict[str, any], now: float) -> JudoData:
+        """Return the snapshot with freshly read values and track them."""
+        data = replace(self.data or JudoData(), **self.identity, **polled)
+        self.updated_at.update(dict.fromkeys(polled, now))
+        self.leak_alert = None
+        if "water_counter" in polled:
+            self._track_water(polled["water_counter"])
+        if "salt_stock" in polled and data.water_counter is not None:
+            self.salt_forecast.add(time.time(), data.water_counter, data.salt_stock)
+        if polled:
+            self.store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+        return data
+
+    def _track_water(self, counter: int) -> None:
+        """Add a water counter reading to the time series and leak detector."""
+        timestamp = time.time()
+        if (sample := self.water_series.add(timestamp, counter)) is None:
+            return
+        self.leak_alert = self.leak_detector.add(timestamp, *sample)
+        if self.leak_alert is not None:
+            _LOGGER.warning("Possible water leak detected: %s", self.leak_alert)
+
+    def _adapt_interval(self, polled_fields: Set[str]) -> None:
+        """Tighten the update interval on activity, back off while idle."""
+        if not polled_fields & ACTIVITY_FIELDS:
+            return
+        minimum, maximum = self.adaptive_bounds
+        current = self.scheduler.default_interval
+        if self.changed_fields & ACTIVITY_FIELDS:
+            interval = minimum
         else:
-            return data
+            interval = min(current * 2, maximum)
+        if interval == current:
+            return
+        _LOGGER.debug("Adapting update interval from %ss to %ss", current, interval)
+        self.scheduler.default_interval = interval
+
+    @callback
+    def async_set_updated_data(self, data: JudoData) -> None:
+        """Set a new snapshot pushed from outside a refresh."""
+        self.changed_fields = _changed_fields(self.data, data)
+        super().async_set_updated_data(data)
+        self._async_schedule_stale_check()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners, which see a leak alert only once."""
+        super().async_update_listeners()
+        self.leak_alert = None
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Schedule the next refresh and re-arm the staleness check."""
+        super()._async_refresh_finished()
+        self.hub.async_reschedule(self)
+        self._async_schedule_stale_check()
+
+    @callback
+    def _async_schedule_stale_check(self) -> None:
+        """Arm a timer for when entities next need to re-check their state.
+
+        Listeners are not called after a refresh fails twice in a row, so
+        without it entities would never see their values go stale. The timer
+        fires when the next field runs past its staleness budget and, while
+        refreshes fail, once per poll interval so the overdue time moves on.
+        """
+        if self._unsub_stale_check is not None:
+            self._unsub_stale_check()
+            self._unsub_stale_check = None
+        now = time.monotonic()
+        deadlines = [
+            deadline
+            for key, updated_at in self.updated_at.items()
+            if (
+                deadline := updated_at
+                + self.scheduler.interval(FIELD_REGISTERS[key])
+                + self.staleness_budget
+            )
+            > now
+        ]
+        if not self.last_update_success:
+            deadlines.append(now + self.poll_interval)
+        if deadlines:
+            self._unsub_stale_check = async_call_later(
+                self.hass, min(deadlines) - now, self._stale_check_job
+            )
+
+    @callback
+    def _async_stale_check(self, _now: object) -> None:
+        """Let entities re-check their availability and values."""
+        self._unsub_stale_check = None
+        self.changed_fields = frozenset()
+        self.async_update_listeners()
+        self._async_schedule_stale_check()
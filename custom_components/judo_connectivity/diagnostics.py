@@ -0,0 +1,52 @@
+"""Diagnostics support for Judo Connectivity Module."""
+
+from dataclasses import asdict
+import time
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_URL
+from .coordinator import JudoDataUpdateCoordinator
+
+TO_REDACT = {
+    CONF_PASSWORD,
+    CONF_URL,
+    CONF_USERNAME,
+    CONF_WEBHOOK_ID,
+    "device_no",
+    "title",
+    "unique_id",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, any]:
+    """Return diagnostics for a config entry."""
+    coordinator: JudoDataUpdateCoordinator = entry.runtime_data
+    now = time.monotonic()
+    diagnostics = {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "data": async_redact_data(asdict(coordinator.data), TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "refresh_duration": coordinator.refresh_duration,
+            "poll_interval": coordinator.poll_interval,
+            "default_interval": coordinator.scheduler.default_interval,
+            "overdue": coordinator.overdue(),
+            "field_age": {
+                key: round(now - updated_at, 1)
+                for key, updated_at in coordinator.updated_at.items()
+            },
+        },
+        "client": {
+            command: stats.as_dict()
+            for command, stats in sorted(coordinator.client.stats.items())
+        },
+    }
+    if coordinator.profiler is not None:
+        diagnostics["profile"] = coordinator.profiler.report()
+    return diagnostics
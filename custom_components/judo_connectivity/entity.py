@@ -0,0 +1,62 @@
+"""Base entity for Judo Connectivity Module."""
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import JudoDataUpdateCoordinator
+
+
+class JudoEntity(CoordinatorEntity[JudoDataUpdateCoordinator]):
+    """Base class for Judo entities.
+
+    State is only written when the coordinator reports a change to a field
+    the entity shows, or when its availability flips.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self, coordinator: JudoDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.unique_id)},
+        )
+        self._written_available: bool | None = None
+        if coordinator.profiler is not None:
+            # State writes read every property of the entity
+            coordinator.profiler.instrument(
+                self,
+                (
+                    name
+                    for name in (
+                        "_handle_coordinator_update",
+                        "async_press",
+                        "async_set_native_value",
+                    )
+                    if hasattr(self, name)
+                ),
+            )
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the availability of the initial state."""
+        await super().async_added_to_hass()
+        self._written_available = self.available
+
+    def _data_changed(self) -> bool:
+        """Return if the last coordinator update changed a value of the entity."""
+        return False
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the entity is affected by the update."""
+        available = self.available
+        if available == self._written_available and not self._data_changed():
+            return
+        self._written_available = available
+        self.async_write_ha_state()
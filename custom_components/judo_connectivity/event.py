@@ -0,0 +1,45 @@
+"""Event entities for Judo Connectivity Module."""
+
+from homeassistant.components.event import EventEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .coordinator import JudoDataUpdateCoordinator
+from .entity import JudoEntity
+from .leak import LEAK_BURST, LEAK_CONTINUOUS_FLOW
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the event platform."""
+    coordinator: JudoDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([JudoWaterLeakEvent(coordinator, entry)])
+
+
+class JudoWaterLeakEvent(JudoEntity, EventEntity):
+    """Representation of the alerts raised by the leak detector."""
+
+    _attr_name = "Water Leak Alert"
+    _attr_icon = "mdi:pipe-leak"
+    _attr_event_types = [LEAK_CONTINUOUS_FLOW, LEAK_BURST]
+
+    def __init__(
+        self, coordinator: JudoDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the event entity."""
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.unique_id}_water_leak_alert"
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Fire an event when the update raised a leak alert."""
+        if (alert := self.coordinator.leak_alert) is not None:
+            self._trigger_event(alert)
+            self.async_write_ha_state()
+            return
+        super()._handle_coordinator_update()
@@ -0,0 +1,96 @@
+"""Fleet-wide aggregates over all Judo Connectivity Modules."""
+
+from bisect import bisect_left, insort
+import math
+
+
+class JudoFleet:
+    """Aggregate the latest water counter and salt range of every module.
+
+    When a module reports, only its own contribution is replaced: the water
+    total is adjusted by the difference and its salt range is moved within a
+    sorted list, so no update ever rescans the fleet.
+
+    The water total only grows: it sums what each counter grew by since its
+    module joined the fleet, not the counters themselves. A module joining
+    or leaving does not move it, so statistics see no consumption spike. The
+    total is unknown while an expected module has not reported yet.
+    """
+
+    def __init__(self, refill_days: int) -> None:
+        """Initialize an empty fleet."""
+        self.refill_days = refill_days
+        self.refill_count = 0  # Modules with a salt range of refill_days or less
+        self._water_total = 0
+        self._water: dict[str, int] = {}  # Last counter per module
+        self._missing: set[str] = set()  # Expected modules with no counter yet
+        self._salt_range: dict[str, int] = {}
+        self._salt_ranges: list[int] = []  # Sorted
+
+    def expect(self, module: str) -> None:
+        """Hold back the water total until a module has reported its counter."""
+        if module not in self._water:
+            self._missing.add(module)
+
+    def unexpect(self, module: str) -> bool:
+        """Stop waiting for the counter of a module and return if it was awaited."""
+        if module not in self._missing:
+            return False
+        self._missing.remove(module)
+        return True
+
+    def update_water(self, module: str, water_counter: int) -> bool:
+        """Take the water counter of a module and return if the total changed.
+
+        The first counter of a module, and one lower than the last, only sets
+        where its growth is counted from. The first one still counts as a
+        change, since the total can become known with it.
+        """
+        self._missing.discard(module)
+        previous = self._water.get(module)
+        self._water[module] = water_counter
+        if previous is None or water_counter <= previous:
+            return previous is None
+        self._water_total += water_counter - previous
+        return True
+
+    def update_salt_range(self, module: str, salt_range: int | None) -> bool:
+        """Replace the salt range of a module and return if it changed.
+
+        A salt range of None takes the module out of the salt aggregates.
+        """
+        previous = self._salt_range.pop(module, None)
+        if salt_range is not None:
+            self._salt_range[module] = salt_range
+        if salt_range == previous:
+            return False
+        if previous is not None:
+            del self._salt_ranges[bisect_left(self._salt_ranges, previous)]
+            self.refill_count -= previous <= self.refill_days
+        if salt_range is not None:
+            insort(self._salt_ranges, salt_range)
+            self.refill_count += salt_range <= self.refill_days
+        return True
+
+    def remove(self, module: str) -> bool:
+        """Take a module out of the fleet and return if an aggregate changed.
+
+        The water it drew while in the fleet stays in the total.
+        """
+        self._missing.discard(module)
+        self._water.pop(module, None)
+        return self.update_salt_range(module, None)
+
+    @property
+    def water_volume(self) -> float | None:
+        """Return the water drawn by all modules since they joined, in m³."""
+        if not self._water or self._missing:
+            return None
+        return self._water_total / 1000
+
+    def salt_range_percentile(self, percent: float) -> int | None:
+        """Return a nearest-rank percentile of the salt ranges, in days."""
+        if not self._salt_ranges:
+            return None
+        rank = math.ceil(percent / 100 * len(self._salt_ranges))
+        return self._salt_ranges[max(rank - 1, 0)]
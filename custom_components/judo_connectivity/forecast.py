@@ -0,0 +1,96 @@
+"""Salt consumption forecast for Judo Connectivity Module."""
+
+from collections import deque
+
+
+class JudoSaltForecast:
+    """Forecast when the salt runs out from stock and water counter readings.
+
+    The stock only drops when the softener regenerates, in steps of a few
+    hundred grams, so the rates are taken between regenerations: the salt
+    used per liter is the stock dropped over the last ``regenerations``
+    regenerations divided by the water drawn between them, and the liters
+    drawn per day are taken from the oldest of them to the latest reading.
+    Neither depends on how often the device is polled. The salt that the
+    water drawn since the last regeneration will take is deducted from the
+    stock, so the forecast runs down smoothly instead of in steps. Refills
+    of the stock, read or written, do not affect the rates; a reset of the
+    water counter starts them over.
+    """
+
+    def __init__(self, regenerations: int) -> None:
+        """Initialize the forecast."""
+        # Time, water counter and salt used since the start, per regeneration
+        self._regenerations: deque[tuple[float, int, int]] = deque(
+            maxlen=regenerations + 1
+        )
+        self._used = 0
+        self._last: tuple[float, int, int] | None = None
+
+    def add(self, timestamp: float, water: int, salt: int) -> None:
+        """Add a reading of the water counter in liters and the stock in grams."""
+        if self._last is not None:
+            last_timestamp, last_water, last_salt = self._last
+            if timestamp <= last_timestamp:
+                return
+            if water < last_water:
+                self._regenerations.clear()
+                self._used = 0
+            elif salt < last_salt:
+                self._used += last_salt - salt
+                self._regenerations.append((timestamp, water, self._used))
+        self._last = timestamp, water, salt
+
+    def rebase(self, salt: int) -> None:
+        """Take a stock written to the module as the latest reading.
+
+        A write can lower the stock too, which must not count as salt used.
+        """
+        if self._last is not None:
+            timestamp, water, _ = self._last
+            self._last = timestamp, water, salt
+
+    @property
+    def grams_per_liter(self) -> float | None:
+        """Return the salt used per liter of water."""
+        if len(self._regenerations) < 2:
+            return None
+        _, first_water, first_used = self._regenerations[0]
+        _, water, used = self._regenerations[-1]
+        if water <= first_water:
+            return None
+        return (used - first_used) / (water - first_water)
+
+    @property
+    def liters_per_day(self) -> float | None:
+        """Return the water drawn per day."""
+        if len(self._regenerations) < 2:
+            return None
+        first_timestamp, first_water, _ = self._regenerations[0]
+        timestamp, water, _ = self._last
+        return (water - first_water) * 86400 / (timestamp - first_timestamp)
+
+    def days_to_empty(self) -> float | None:
+        """Return the forecast days until the salt stock is used up."""
+        grams_per_liter = self.grams_per_liter
+        liters_per_day = self.liters_per_day
+        if not grams_per_liter or not liters_per_day:
+            return None
+        _, regeneration_water, _ = self._regenerations[-1]
+        _, water, salt = self._last
+        stock = max(salt - grams_per_liter * (water - regeneration_water), 0)
+        return round(stock / (grams_per_liter * liters_per_day), 1)
+
+    def as_dict(self) -> dict[str, any]:
+        """Return the forecast state in a form that can be stored as JSON."""
+        return {
+            "history": list(self._regenerations),
+            "used": self._used,
+            "last": self._last,
+        }
+
+    def restore(self, stored: dict[str, any]) -> None:
+        """Restore a state returned by ``as_dict``."""
+        self._regenerations.extend(tuple(item) for item in stored["history"])
+        self._used = stored["used"]
+        self._last = stored["last"] and tuple(stored["last"])
@@ -0,0 +1,227 @@
+"""Shared polling hub for all Judo Connectivity Modules of an instance."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from functools import partial
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, FLEET_REFILL_DAYS, HUB_MAX_PARALLEL_REQUESTS
+from .fleet import JudoFleet
+
+if TYPE_CHECKING:
+    from .coordinator import JudoDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HUB: HassKey[JudoHub] = HassKey(f"{DOMAIN}_hub")
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> JudoHub:
+    """Return the hub of the instance, creating it on first use."""
+    if (hub := hass.data.get(DATA_HUB)) is None:
+        hub = hass.data[DATA_HUB] = JudoHub(hass)
+    return hub
+
+
+def _stagger_fraction(slot: int) -> float:
+    """Return the poll offset of a slot as a fraction of its interval.
+
+    Follows the base-2 van der Corput sequence (0, 1/2, 1/4, 3/4, ...), which
+    spreads any number of modules evenly without knowing the total up front.
+    """
+    fraction = 0.0
+    denominator = 1
+    while slot:
+        denominator *= 2
+        slot, bit = divmod(slot, 2)
+        fraction += bit / denominator
+    return fraction
+
+
+class JudoHub:
+    """Drive the refreshes of all coordinators from one staggered timer.
+
+    Coordinators have no timer of their own. Each one gets a slot that
+    offsets its first poll within its interval, so modules set up together
+    do not poll in lockstep; after that, a coordinator is refreshed when its
+    next register is due. Every request goes through one global limit on top
+    of the per-module cap.
+
+    The hub also keeps the fleet aggregates. Their sensors are added by one
+    loaded entry, the host, and move to another entry when the host unloads.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self.request_limit = asyncio.Semaphore(HUB_MAX_PARALLEL_REQUESTS)
+        self._slots: dict[JudoDataUpdateCoordinator, int] = {}
+        self._next_refresh: dict[JudoDataUpdateCoordinator, float] = {}
+        self._refresh_job = HassJob(self._async_refresh_due, cancel_on_shutdown=True)
+        self._unsub_refresh: CALLBACK_TYPE | None = None
+        self._scheduled_at = 0.0
+        self.fleet = JudoFleet(FLEET_REFILL_DAYS)
+        # The fleet water total waits for every module set up at start, until
+        # it reports or fails to load
+        for entry in hass.config_entries.async_entries(
+            DOMAIN, include_ignore=False, include_disabled=False
+        ):
+            self.fleet.expect(entry.entry_id)
+        self._unsub_fleet: dict[JudoDataUpdateCoordinator, CALLBACK_TYPE] = {}
+        self._fleet_listeners: list[CALLBACK_TYPE] = []
+        self._fleet_hosts: dict[str, Callable[[], None]] = {}
+        self._fleet_host: str | None = None
+
+    @callback
+    def async_add_coordinator(
+        self, coordinator: JudoDataUpdateCoordinator
+    ) -> CALLBACK_TYPE:
+        """Start polling a coordinator and return a callback to stop it."""
+        slot = next(
+            slot for slot in range(len(self._slots) + 1)
+            if slot not in self._slots.values()
+        )
+        self._slots[coordinator] = slot
+        interval = coordinator.poll_interval
+        self._next_refresh[coordinator] = self.hass.loop.time() + interval * (
+            _stagger_fraction(slot) or 1
+        )
+        self._async_schedule()
+        self._unsub_fleet[coordinator] = coordinator.async_add_listener(
+            partial(self._async_update_fleet, coordinator)
+        )
+        self._async_update_fleet(coordinator)
+        return partial(self._async_remove_coordinator, coordinator)
+
+    @callback
+    def _async_remove_coordinator(
+        self, coordinator: JudoDataUpdateCoordinator
+    ) -> None:
+        """Stop polling a coordinator."""
+        self._slots.pop(coordinator, None)
+        self._next_refresh.pop(coordinator, None)
+        self._async_schedule()
+        if (unsub := self._unsub_fleet.pop(coordinator, None)) is not None:
+            unsub()
+        # The last water counter is kept, so the water drawn while the entry
+        # is unloaded is added once it reports again
+        entry_id = coordinator.config_entry.entry_id
+        changed = self.fleet.unexpect(entry_id)
+        if self.fleet.update_salt_range(entry_id, None):
+            changed = True
+        if changed:
+            self._async_notify_fleet()
+
+    @callback
+    def async_skip_module(self, entry_id: str) -> None:
+        """Stop the fleet water total waiting for a module that failed to load."""
+        if self.fleet.unexpect(entry_id):
+            self._async_notify_fleet()
+
+    @callback
+    def async_remove_module(self, entry_id: str) -> None:
+        """Take a removed module out of the fleet aggregates."""
+        if self.fleet.remove(entry_id):
+            self._async_notify_fleet()
+
+    @callback
+    def _async_update_fleet(self, coordinator: JudoDataUpdateCoordinator) -> None:
+        """Replace the contribution of a module to the fleet aggregates."""
+        if (data := coordinator.data) is None:
+            return
+        entry_id = coordinator.config_entry.entry_id
+        changed = data.water_counter is not None and self.fleet.update_water(
+            entry_id, data.water_counter
+        )
+        if self.fleet.update_salt_range(
+            entry_id, data.salt_range if coordinator.is_fresh("salt_range") else None
+        ):
+            changed = True
+        if changed:
+            self._async_notify_fleet()
+
+    @callback
+    def _async_notify_fleet(self) -> None:
+        """Tell the fleet sensors that an aggregate changed."""
+        for update_callback in list(self._fleet_listeners):
+            update_callback()
+
+    @callback
+    def async_add_fleet_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for changes of the fleet aggregates."""
+        self._fleet_listeners.append(update_callback)
+        return partial(self._fleet_listeners.remove, update_callback)
+
+    @callback
+    def async_add_fleet_host(
+        self, entry_id: str, add_entities: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Offer an entry to host the fleet sensors.
+
+        ``add_entities`` adds the sensors to the entry. It is called right
+        away when no entry hosts them yet, or later when the host unloads.
+        """
+        self._fleet_hosts[entry_id] = add_entities
+        if self._fleet_host is None:
+            self._fleet_host = entry_id
+            add_entities()
+        return partial(self._async_remove_fleet_host, entry_id)
+
+    @callback
+    def _async_remove_fleet_host(self, entry_id: str) -> None:
+        """Withdraw an entry, handing the fleet sensors on if it hosted them."""
+        self._fleet_hosts.pop(entry_id, None)
+        if self._fleet_host != entry_id:
+            return
+        self._fleet_host = next(iter(self._fleet_hosts), None)
+        if self._fleet_host is not None:
+            self._fleet_hosts[self._fleet_host]()
+
+    @callback
+    def async_reschedule(self, coordinator: JudoDataUpdateCoordinator) -> None:
+        """Schedule the next refresh of a coordinator for its next due register."""
+        if coordinator not in self._next_refresh:
+            return
+        self._next_refresh[coordinator] = (
+            self.hass.loop.time() + coordinator.next_poll_delay()
+        )
+        self._async_schedule()
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Arm the timer for the next coordinator that is due."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+        if not self._next_refresh:
+            return
+        self._scheduled_at = min(self._next_refresh.values())
+        delay = self._scheduled_at - self.hass.loop.time()
+        self._unsub_refresh = async_call_later(
+            self.hass, max(delay, 0), self._refresh_job
+        )
+
+    @callback
+    def _async_refresh_due(self, _now: object) -> None:
+        """Refresh every coordinator that is due and re-arm the timer."""
+        self._unsub_refresh = None
+        now = max(self.hass.loop.time(), self._scheduled_at)
+        for coordinator, next_refresh in self._next_refresh.items():
+            if next_refresh > now:
+                continue
+            # Until the refresh reschedules it once it is done
+            self._next_refresh[coordinator] = now + coordinator.poll_interval
+            coordinator.config_entry.async_create_background_task(
+                self.hass,
+                coordinator.async_refresh(),
+                f"{DOMAIN} refresh {coordinator.config_entry.title}",
+            )
+        self._async_schedule()
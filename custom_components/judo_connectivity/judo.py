@@ -1,32 +1,384 @@
 """Judo Connectivity Module API client."""
 
+import asyncio
+import binascii
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import partial
+import json
+import logging
+import random
+import re
+import struct
+import time
+
 import aiohttp
 
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds a read result is served to later callers without a new request
+CACHE_TTL = 2.0
+# Seconds a single request may take
+REQUEST_TIMEOUT = 10.0
+# Attempts per read and the base of the jittered exponential backoff between them
+READ_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5
+# Consecutive failed calls that open the circuit, and how long it stays open
+CIRCUIT_THRESHOLD = 3
+CIRCUIT_COOLDOWN = 30.0
+CIRCUIT_MAX_COOLDOWN = 600.0
+# Cheapest read (1 byte payload), used to probe a module behind an open circuit
+PROBE_COMMAND = "FF00"
+# Upper bounds in seconds of the request latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Hex payload of a response body, found without parsing the JSON around it
+_DATA_FIELD = re.compile(rb'"data"\s*:\s*"([0-9A-Fa-f]*)"')
+
+
+class JudoError(Exception):
+    """Base error of the Judo client."""
+
+
+class JudoConnectionError(JudoError):
+    """The module could not be reached or returned an error."""
+
+
+class JudoAuthenticationError(JudoError):
+    """The module rejected the credentials."""
+
+
+class JudoCircuitOpenError(JudoConnectionError):
+    """Requests are suspended because the module stopped responding."""
+
+
+def _decode_body(body: bytes) -> bytes:
+    """Return the payload of a response body, ``{"data": "<hex>"}``.
+
+    The hex digits are converted straight from the body buffer. Bodies that
+    do not match the expected shape go through the JSON parser instead.
+    """
+    try:
+        if (match := _DATA_FIELD.search(body)) is not None:
+            return binascii.unhexlify(memoryview(body)[match.start(1) : match.end(1)])
+        return bytes.fromhex(json.loads(body)["data"])
+    except (ValueError, KeyError, TypeError) as err:
+        raise JudoConnectionError(f"Malformed response: {body[:64]!r}") from err
+
+
+@dataclass(slots=True)
+class JudoCommandStats:
+    """Request statistics of one command."""
+
+    requests: int = 0
+    failures: int = 0
+    retries: int = 0
+    cache_hits: int = 0
+    bytes_received: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    # Requests per LATENCY_BUCKETS bucket, the last one for slower requests
+    latency_buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+    errors: Counter[str] = field(default_factory=Counter)  # Per error class
+
+    def record(
+        self, latency: float, size: int = 0, error: BaseException | None = None
+    ) -> None:
+        """Record a request that took ``latency`` seconds."""
+        self.requests += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.latency_buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.bytes_received += size
+        if error is not None:
+            self.failures += 1
+            self.errors[type(error).__name__] += 1
+
+    def as_dict(self) -> dict[str, any]:
+        """Return the statistics as plain data."""
+        buckets = [*(f"<={bound}s" for bound in LATENCY_BUCKETS), "slower"]
+        mean = self.latency_total / self.requests if self.requests else None
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "bytes_received": self.bytes_received,
+            "latency_mean": mean,
+            "latency_max": self.latency_max,
+            "latency_buckets": dict(zip(buckets, self.latency_buckets, strict=True)),
+            "errors": dict(self.errors),
+        }
+
 
 class JudoClient:
     """Client to interact with Judo Connectivity Module API."""
 
-    def __init__(self, url: str, port: int, username: str, password: str) -> None:
-        """Initialize the client."""
+    def __init__(
+        self,
+        url: str,
+        port: int,
+        username: str,
+        password: str,
+        session: aiohttp.ClientSession | None = None,
+        cache_ttl: float = CACHE_TTL,
+    ) -> None:
+        """Initialize the client.
+
+        All requests share one keep-alive session. A session created by the
+        client is closed in ``async_close``; an injected one is left open.
+        """
         self.base_url = f"{url}:{port}/api/rest"
         self.auth = aiohttp.BasicAuth(username, password)
+        self._session = session
+        self._close_session = session is None
+        self._cache_ttl = cache_ttl
+        self._cache: dict[str, tuple[float, bytes]] = {}
+        self._in_flight: dict[str, asyncio.Task[bytes]] = {}
+        self._timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        self._failures = 0
+        self._cooldown = CIRCUIT_COOLDOWN
+        self._open_until: float | None = None
+        self._probe_lock = asyncio.Lock()
+        # Pending writes per register, merged so only the last value is sent
+        self._writes: dict[str, bytes] = {}
+        self._write_waiters: dict[str, list[asyncio.Future[None]]] = {}
+        self._write_task: asyncio.Task[None] | None = None
+        self._writes_idle = asyncio.Event()
+        self._writes_idle.set()
+        # Writes sent per register, so reads overtaken by a write are not cached
+        self._write_generation: dict[str, int] = {}
+        self.stats: dict[str, JudoCommandStats] = {}  # Per 4 digit command
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the session used for requests, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+            self._close_session = True
+        return self._session
 
     async def async_fetch_data(self, command: str) -> str:
-        """Fetch data from the Judo API."""
-        async with (
-            aiohttp.ClientSession() as session,
-            session.get(f"{self.base_url}/{command}", auth=self.auth) as resp,
-        ):
-            resp.raise_for_status()
-            data = await resp.json()
-            return data["data"]
+        """Fetch data from the Judo API as a hex string."""
+        return (await self.async_fetch_payload(command)).hex()
+
+    async def async_fetch_payload(self, command: str) -> bytes:
+        """Fetch the payload of a command from the Judo API.
+
+        Concurrent calls for the same command share one request, and its
+        result is reused for ``cache_ttl`` seconds.
+        """
+        cached = self._cache.get(command)
+        if cached is not None and cached[0] > time.monotonic():
+            self._stats(command).cache_hits += 1
+            return cached[1]
+        if (task := self._in_flight.get(command)) is None:
+            task = asyncio.create_task(self._async_request(command))
+            task.add_done_callback(partial(self._request_done, command))
+            self._in_flight[command] = task
+        # Shielded so a cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+
+    async def _async_request(self, command: str) -> bytes:
+        """Read a command with retries and cache its payload.
+
+        Reads wait for pending writes, so they never return values the
+        writes are about to replace.
+        """
+        await self._writes_idle.wait()
+        generation = self._write_generation.get(command[:4])
+        try:
+            await self._async_check_circuit()
+        except JudoCircuitOpenError as err:
+            self._stats(command).errors[type(err).__name__] += 1
+            raise
+        for attempt in range(READ_ATTEMPTS):
+            try:
+                body = await self._async_get(command)
+            except JudoConnectionError as err:
+                if attempt == READ_ATTEMPTS - 1:
+                    self._record_failure()
+                    raise
+                self._stats(command).retries += 1
+                delay = random.uniform(0, RETRY_BACKOFF * 2**attempt)
+                _LOGGER.debug(
+                    "Command %s failed (%s), retrying in %.2fs", command, err, delay
+                )
+                await asyncio.sleep(delay)
+            else:
+                break
+        self._record_success()
+        payload = _decode_body(body)
+        if self._write_generation.get(command[:4]) == generation:
+            self._cache[command] = (time.monotonic() + self._cache_ttl, payload)
+        return payload
+
+    @property
+    def failures(self) -> int:
+        """Return the number of failed requests across all commands."""
+        return sum(stats.failures for stats in self.stats.values())
+
+    @property
+    def mean_latency(self) -> float | None:
+        """Return the mean request latency across all commands, in seconds."""
+        requests = sum(stats.requests for stats in self.stats.values())
+        if not requests:
+            return None
+        return sum(stats.latency_total for stats in self.stats.values()) / requests
+
+    def _stats(self, command: str) -> JudoCommandStats:
+        """Return the statistics of a command, ignoring its arguments."""
+        if (stats := self.stats.get(command[:4])) is None:
+            stats = self.stats[command[:4]] = JudoCommandStats()
+        return stats
+
+    async def _async_get(self, command: str) -> bytes:
+        """Send one request to the module and return its body."""
+        start = time.perf_counter()
+        try:
+            async with self.session.get(
+                f"{self.base_url}/{command}", auth=self.auth, timeout=self._timeout
+            ) as resp:
+                if resp.status in (401, 403):
+                    raise JudoAuthenticationError(f"Access denied ({resp.status})")
+                resp.raise_for_status()
+                body = await resp.read()
+        except JudoAuthenticationError as err:
+            self._stats(command).record(time.perf_counter() - start, error=err)
+            raise
+        except (aiohttp.ClientError, TimeoutError) as err:
+            self._stats(command).record(time.perf_counter() - start, error=err)
+            raise JudoConnectionError(f"Command {command} failed: {err!r}") from err
+        self._stats(command).record(time.perf_counter() - start, len(body))
+        return body
+
+    async def _async_check_circuit(self) -> None:
+        """Fail fast while the circuit is open; probe once its cooldown passed."""
+        if self._open_until is None:
+            return
+        async with self._probe_lock:
+            if self._open_until is None:
+                return  # Another caller's probe closed the circuit
+            if time.monotonic() < self._open_until:
+                raise JudoCircuitOpenError("Judo module is not responding")
+            try:
+                await self._async_get(PROBE_COMMAND)
+            except JudoConnectionError as err:
+                self._cooldown = min(self._cooldown * 2, CIRCUIT_MAX_COOLDOWN)
+                self._open_until = time.monotonic() + self._cooldown
+                raise JudoCircuitOpenError("Judo module is not responding") from err
+            _LOGGER.info("Judo module at %s is responding again", self.base_url)
+            self._record_success()
+
+    def _record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        self._failures = 0
+        self._cooldown = CIRCUIT_COOLDOWN
+        self._open_until = None
+
+    def _record_failure(self) -> None:
+        """Count a failed call and open the circuit past the threshold."""
+        self._failures += 1
+        if self._failures >= CIRCUIT_THRESHOLD and self._open_until is None:
+            _LOGGER.warning(
+                "Judo module at %s is not responding, pausing requests for %ss",
+                self.base_url,
+                self._cooldown,
+            )
+            self._open_until = time.monotonic() + self._cooldown
+
+    def _request_done(self, command: str, task: asyncio.Task[bytes]) -> None:
+        """Forget a finished shared request."""
+        if self._in_flight.get(command) is task:
+            del self._in_flight[command]
+        if not task.cancelled():
+            # Retrieve the exception in case every caller was cancelled
+            task.exception()
+
+    async def async_write(self, register: str, payload: bytes) -> None:
+        """Write a payload to a register.
+
+        Writes go through one queue per client and are sent one at a time,
+        ahead of any read that has not started yet. A write replaces one
+        still queued for the same register; both callers then wait for the
+        merged write.
+        """
+        await self.async_write_many({register: payload})
+
+    async def async_write_many(self, writes: Mapping[str, bytes]) -> None:
+        """Write payloads to several registers in one queued batch."""
+        loop = asyncio.get_running_loop()
+        waiters = []
+        for register, payload in writes.items():
+            self._writes[register] = payload
+            waiter = loop.create_future()
+            self._write_waiters.setdefault(register, []).append(waiter)
+            waiters.append(waiter)
+        self._writes_idle.clear()
+        if self._write_task is None:
+            self._write_task = asyncio.create_task(self._async_drain_writes())
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _async_drain_writes(self) -> None:
+        """Send queued writes one at a time until the queue is empty."""
+        try:
+            while self._writes:
+                register = next(iter(self._writes))
+                payload = self._writes.pop(register)
+                waiters = self._write_waiters.pop(register)
+                try:
+                    await self._async_send_write(register, payload)
+                except JudoError as err:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(err)
+                else:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_result(None)
+        finally:
+            self._write_task = None
+            self._writes_idle.set()
+
+    async def _async_send_write(self, register: str, payload: bytes) -> None:
+        """Send one write and drop the cached read of its register.
+
+        A read of the register still in flight is no longer shared with new
+        callers, and its result is not cached, since it may predate the write.
+        """
+        self._write_generation[register] = self._write_generation.get(register, 0) + 1
+        self._cache.pop(register, None)
+        self._in_flight.pop(register, None)
+        await self._async_check_circuit()
+        try:
+            await self._async_get(f"{register}{payload.hex().upper()}")
+        except JudoConnectionError:
+            self._record_failure()
+            raise
+        self._record_success()
 
     async def async_set_salt_refill(self, mass_grams: int) -> None:
-        """Set the salt refill mass."""
-        hex_mass = f"{mass_grams:08x}"
-        command = f"5600{hex_mass}"
-        async with (
-            aiohttp.ClientSession() as session,
-            session.get(f"{self.base_url}/{command}", auth=self.auth) as resp,
-        ):
-            resp.raise_for_status()
+        """Set the salt refill mass, sent as 2 bytes LSB first."""
+        await self.async_write("5600", struct.pack("<H", mass_grams))
+
+    async def async_close(self) -> None:
+        """Cancel shared requests and close the session if owned by the client."""
+        for task in self._in_flight.values():
+            task.cancel()
+        if self._write_task is not None:
+            self._write_task.cancel()
+        for waiters in self._write_waiters.values():
+            for waiter in waiters:
+                waiter.cancel()
+        self._writes.clear()
+        self._write_waiters.clear()
+        self._cache.clear()
+        if self._close_session and self._session is not None:
+            await self._session.close()
+        self._session = None
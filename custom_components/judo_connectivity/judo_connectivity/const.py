@@ -1,15 +0,0 @@
-"""Constants for the Judo Connectivity Module integration."""
-
-DOMAIN = "judo_connectivity"
-
-CONF_URL = "url"
-CONF_PORT = "port"
-CONF_UPDATE_INTERVAL = "update_interval"
-
-DEVICE_TYPES = {
-    0x34: "SOFTwell P",
-    0x35: "SOFTwell S",
-    0x36: "SOFTwell K",
-    0x47: "SOFTwell KP",
-    0x48: "SOFTwell KS",
-}
@@ -0,0 +1,107 @@
+"""Streaming leak detection for Judo Connectivity Module."""
+
+import math
+
+LEAK_CONTINUOUS_FLOW = "continuous_flow"
+LEAK_BURST = "burst"
+
+
+class JudoLeakDetector:
+    """Flag leaks from the water drawn between counter readings.
+
+    Water that keeps flowing for longer than ``continuous_flow`` seconds
+    suggests a running tap or a leak, since normal use always has idle gaps.
+    Only a pause of at least ``min_pause`` seconds interrupts the flow, so a
+    slow leak the counter only sees every few readings still counts as
+    flowing; a gap that long between two readings is a pause too, since the
+    counter cannot tell whether water ran during it. A flow rate more than
+    ``burst_sigma`` standard deviations above the mean of the flows seen so
+    far is reported as a burst. The flow start, the last flow and Welford's
+    running mean and variance are updated with each reading, so every reading
+    is checked in constant time and no history is ever rescanned.
+    """
+
+    def __init__(
+        self,
+        continuous_flow: float,
+        min_pause: float,
+        burst_sigma: float,
+        min_samples: int,
+    ) -> None:
+        """Initialize the detector."""
+        self.continuous_flow = continuous_flow
+        self.min_pause = min_pause
+        self.burst_sigma = burst_sigma
+        self.min_samples = min_samples
+        self.alert: str | None = None
+        self._flow_start: float | None = None  # Since the last pause
+        self._flow_end: float | None = None  # Last reading water was drawn by
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    @property
+    def mean(self) -> float:
+        """Return the mean flow rate in liters per minute."""
+        return self._mean
+
+    @property
+    def stdev(self) -> float:
+        """Return the standard deviation of the flow rate."""
+        if self._count < 2:
+            return 0.0
+        return math.sqrt(self._m2 / (self._count - 1))
+
+    def add(self, timestamp: float, liters: int, seconds: float) -> str | None:
+        """Check a reading and return the alert it raised, if any.
+
+        ``liters`` were drawn during the ``seconds`` before ``timestamp``.
+        """
+        previous = self.alert
+        if liters and seconds < self.min_pause:
+            if self._flow_start is None:
+                self._flow_start = timestamp - seconds
+            self._flow_end = timestamp
+        elif seconds >= self.min_pause or (
+            self._flow_end is not None
+            and timestamp - self._flow_end >= self.min_pause
+        ):
+            self._flow_start = self._flow_end = None
+        if (
+            self._flow_start is not None
+            and timestamp - self._flow_start >= self.continuous_flow
+        ):
+            self.alert = LEAK_CONTINUOUS_FLOW
+        else:
+            self.alert = None
+        if not liters:
+            return self.alert if self.alert != previous else None
+        rate = liters * 60 / seconds
+        if (
+            self._count >= self.min_samples
+            and rate > self._mean + self.burst_sigma * self.stdev
+        ):
+            self.alert = LEAK_BURST
+        self._count += 1
+        delta = rate - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (rate - self._mean)
+        return self.alert if self.alert != previous else None
+
+    def as_dict(self) -> dict[str, any]:
+        """Return the detector state in a form that can be stored as JSON."""
+        return {
+            "flow_start": self._flow_start,
+            "flow_end": self._flow_end,
+            "count": self._count,
+            "mean": self._mean,
+            "m2": self._m2,
+        }
+
+    def restore(self, stored: dict[str, any]) -> None:
+        """Restore a state returned by ``as_dict``."""
+        self._flow_start = stored["flow_start"]
+        self._flow_end = stored["flow_end"]
+        self._count = stored["count"]
+        self._mean = stored["mean"]
+        self._m2 = stored["m2"]
@@ -4,11 +4,11 @@ from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfMass
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import JudoDataUpdateCoordinator
+from .entity import JudoEntity
 
 
 async def async_setup_entry(
@@ -21,7 +21,7 @@ async def async_setup_entry(
     async_add_entities([JudoSaltRefillMassNumber(coordinator, entry)])
 
 
-class JudoSaltRefillMassNumber(NumberEntity):
+class JudoSaltRefillMassNumber(JudoEntity, NumberEntity):
     """Representation of the Regeneration Salt Refill Mass number."""
 
     _attr_name = "Regeneration Salt Refill Mass"
@@ -36,25 +36,15 @@ class JudoSaltRefillMassNumber(NumberEntity):
         self, coordinator: JudoDataUpdateCoordinator, entry: ConfigEntry
     ) -> None:
         """Initialize the number entity."""
-        self.coordinator = coordinator
-        self._entry = entry
-        self._attr_has_entity_name = True
+        super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.unique_id}_regeneration_salt_refill_mass"
-        self._attr_native_value = 5.0  # Default value
 
     @property
-    def device_info(self) -> DeviceInfo | None:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.unique_id)},
-        )
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
+    def native_value(self) -> float:
+        """Return the mass the refill button writes."""
+        return self.coordinator.salt_refill_mass
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the value (not directly triggering API here)."""
-        self._attr_native_value = value
+        self.coordinator.salt_refill_mass = value
         self.async_write_ha_state()
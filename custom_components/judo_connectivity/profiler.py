@@ -0,0 +1,136 @@
+"""Opt-in event loop profiler for Judo Connectivity Module."""
+
+from collections.abc import Callable, Coroutine, Generator, Iterable
+from dataclasses import dataclass
+import functools
+import inspect
+import sys
+import time
+
+# Seconds a single uninterrupted run on the event loop may take
+BLOCKING_THRESHOLD = 0.005
+
+
+@dataclass(slots=True)
+class JudoProfileStats:
+    """Timing and allocations of one profiled callable."""
+
+    calls: int = 0
+    slices: int = 0  # Uninterrupted runs on the loop, one per call if sync
+    total_time: float = 0.0
+    max_time: float = 0.0  # Longest slice
+    blocking: int = 0  # Slices longer than BLOCKING_THRESHOLD
+    allocated_blocks: int = 0  # Net memory blocks allocated
+
+    def record(self, elapsed: float, blocks: int) -> None:
+        """Record a slice that ran for ``elapsed`` seconds."""
+        self.slices += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.allocated_blocks += blocks
+        if elapsed > BLOCKING_THRESHOLD:
+            self.blocking += 1
+
+
+class _TimedCoroutine:
+    """Await a coroutine, timing every slice it runs on the event loop.
+
+    Time spent suspended, waiting for I/O, is not counted; only the time
+    the coroutine holds the loop between two suspensions is.
+    """
+
+    __slots__ = ("_coro", "_stats")
+
+    def __init__(self, coro: Coroutine, stats: JudoProfileStats) -> None:
+        """Initialize the wrapper."""
+        self._coro = coro
+        self._stats = stats
+
+    def __await__(self) -> Generator[any, any, any]:
+        """Drive the coroutine one slice at a time."""
+        send, error = None, None
+        while True:
+            blocks = sys.getallocatedblocks()
+            start = time.perf_counter()
+            try:
+                if error is None:
+                    future = self._coro.send(send)
+                else:
+                    future = self._coro.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self._stats.record(
+                    time.perf_counter() - start, sys.getallocatedblocks() - blocks
+                )
+            try:
+                send, error = (yield future), None
+            except BaseException as err:
+                # Cancellation and errors thrown in go on to the coroutine
+                send, error = None, err
+
+
+class JudoProfiler:
+    """Record how long profiled callables hold the event loop.
+
+    Profiling is opt-in: only the callables passed to ``instrument`` or
+    ``wrap`` are measured, everything else runs unchanged.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self.stats: dict[str, JudoProfileStats] = {}
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """Return ``func`` wrapped to record its statistics under ``name``."""
+        stats = self.stats.setdefault(name, JudoProfileStats())
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def _async_profiled(*args: any, **kwargs: any) -> any:
+                stats.calls += 1
+                return await _TimedCoroutine(func(*args, **kwargs), stats)
+
+            return _async_profiled
+
+        @functools.wraps(func)
+        def _profiled(*args: any, **kwargs: any) -> any:
+            stats.calls += 1
+            blocks = sys.getallocatedblocks()
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats.record(
+                    time.perf_counter() - start, sys.getallocatedblocks() - blocks
+                )
+
+        return _profiled
+
+    def instrument(self, obj: object, names: Iterable[str]) -> None:
+        """Replace methods of an object by profiled versions."""
+        for name in names:
+            setattr(
+                obj,
+                name,
+                self.wrap(f"{type(obj).__name__}.{name}", getattr(obj, name)),
+            )
+
+    def report(self, count: int = 10) -> list[dict[str, any]]:
+        """Return the ``count`` callables with the longest slices."""
+        ranked = sorted(
+            self.stats.items(), key=lambda item: item[1].max_time, reverse=True
+        )
+        return [
+            {
+                "name": name,
+                "calls": stats.calls,
+                "slices": stats.slices,
+                "total_ms": round(stats.total_time * 1000, 3),
+                "max_ms": round(stats.max_time * 1000, 3),
+                "blocking_slices": stats.blocking,
+                "allocated_blocks": stats.allocated_blocks,
+            }
+            for name, stats in ranked[:count]
+        ]
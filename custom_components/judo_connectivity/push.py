@@ -0,0 +1,70 @@
+"""Push updates for Judo Connectivity Module.
+
+The module firmware can only be polled. Anything on the local network that
+reads or mirrors it, such as a gateway script, can push register payloads to
+a webhook instead, in the same form the REST API returns them. Registers that
+are pushed are not polled; the others, and those whose pushes stop, are.
+"""
+
+from http import HTTPStatus
+import logging
+import struct
+
+from aiohttp import web
+
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DOMAIN
+from .coordinator import JudoDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_setup_push(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: JudoDataUpdateCoordinator,
+    webhook_id: str,
+) -> CALLBACK_TYPE:
+    """Accept pushed register payloads on a webhook and return its remover.
+
+    The body is one ``{"command": "2900", "data": "2EDC0000"}`` object or a
+    list of them.
+    """
+
+    async def _async_handle_webhook(
+        hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response:
+        """Apply the payloads of a push request."""
+        try:
+            body = await request.json()
+            updates = body if isinstance(body, list) else [body]
+            coordinator.async_push(
+                {
+                    update["command"]: bytes.fromhex(update["data"])
+                    for update in updates
+                }
+            )
+        except (KeyError, TypeError, ValueError, struct.error) as err:
+            _LOGGER.debug("Invalid push to %s: %s", entry.title, err)
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+        return web.Response(status=HTTPStatus.OK)
+
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        entry.title,
+        webhook_id,
+        _async_handle_webhook,
+        local_only=True,
+        allowed_methods=[webhook.METH_POST],
+    )
+    _LOGGER.info(
+        "Push updates for %s are accepted at %s",
+        entry.title,
+        webhook.async_generate_path(webhook_id),
+    )
+    return lambda: webhook.async_unregister(hass, webhook_id)
@@ -0,0 +1,211 @@
+"""Register map of the Judo Connectivity Module REST API.
+
+Every command the integration reads is described once here: its byte layout,
+the values decoded from it, the sensors exposing them and how often it is
+polled. Layouts follow the bundled REST API command reference; multi-byte
+values are sent LSB first.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import struct
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import UnitOfMass, UnitOfTime, UnitOfVolume
+
+from .const import DEVICE_TYPES
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class JudoField:
+    """A value decoded from a register payload."""
+
+    key: str
+    index: int = 0
+    scale: float = 1
+    convert: Callable[[tuple[int, ...]], any] | None = None
+    description: SensorEntityDescription | None = None
+
+    def value(self, raw: tuple[int, ...]) -> any:
+        """Return the value of the field from the unpacked payload."""
+        if self.convert is not None:
+            return self.convert(raw)
+        if self.scale != 1:
+            return raw[self.index] * self.scale
+        return raw[self.index]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class JudoRegister:
+    """A readable command, its payload layout and its polling schedule."""
+
+    command: str
+    layout: struct.Struct
+    fields: tuple[JudoField, ...]
+    identity: bool = False  # Static, read at setup instead of polled
+    interval: int | None = None  # Seconds, None follows the update interval
+    priority: int = 0  # Lower is fetched first
+
+    def decode(self, payload: bytes) -> dict[str, any]:
+        """Decode a payload into the values of the register's fields."""
+        raw = self.layout.unpack_from(payload)
+        return {field.key: field.value(raw) for field in self.fields}
+
+
+def _operating_hours(raw: tuple[int, ...]) -> float:
+    """Convert minutes, hours and days into hours."""
+    minutes, hours, days = raw
+    return round(days * 24 + hours + minutes / 60, 1)
+
+
+def _sw_version(raw: tuple[int, ...]) -> str:
+    """Format the software version, stored as revision, minor, major."""
+    _, minor, major = raw
+    return f"{major}.{minor:02d}"
+
+
+REGISTERS: tuple[JudoRegister, ...] = (
+    JudoRegister(
+        command="FF00",
+        layout=struct.Struct("<B"),
+        identity=True,
+        fields=(
+            JudoField(
+                key="device_type",
+                convert=lambda raw: DEVICE_TYPES.get(raw[0], "Unknown"),
+                description=SensorEntityDescription(
+                    key="device_type",
+                    name="Device Type",
+                    icon="mdi:water-pump",
+                ),
+            ),
+        ),
+    ),
+    JudoRegister(
+        command="0600",
+        layout=struct.Struct("<I"),
+        identity=True,
+        fields=(
+            JudoField(
+                key="device_no",
+                description=SensorEntityDescription(
+                    key="device_number",
+                    name="Device Number",
+                    icon="mdi:numeric",
+                ),
+            ),
+        ),
+    ),
+    JudoRegister(
+        command="0100",
+        layout=struct.Struct("<3B"),
+        identity=True,
+        fields=(
+            JudoField(
+                key="sw_version",
+                convert=_sw_version,
+                description=SensorEntityDescription(
+                    key="software_version",
+                    name="Software Version",
+                    icon="mdi:chip",
+                ),
+            ),
+        ),
+    ),
+    JudoRegister(
+        command="2900",
+        layout=struct.Struct("<I"),
+        priority=0,
+        fields=(
+            JudoField(key="water_counter"),  # Liters, feeds the time series
+            JudoField(
+                key="total_water_volume",
+                scale=0.001,  # Liters to m³
+                description=SensorEntityDescription(
+                    key="total_water_volume",
+                    name="Total Water Volume",
+                    device_class=SensorDeviceClass.WATER,
+                    state_class=SensorStateClass.TOTAL_INCREASING,
+                    native_unit_of_measurement=UnitOfVolume.CUBIC_METERS,
+                    icon="mdi:water",
+                ),
+            ),
+        ),
+    ),
+    JudoRegister(
+        command="5600",
+        layout=struct.Struct("<HH"),
+        priority=1,
+        fields=(
+            JudoField(
+                key="salt_stock",
+                index=0,
+                description=SensorEntityDescription(
+                    key="regeneration_salt_stock",
+                    name="Regeneration Salt Stock",
+                    device_class=SensorDeviceClass.WEIGHT,
+                    native_unit_of_measurement=UnitOfMass.GRAMS,
+                    icon="mdi:weight",
+                ),
+            ),
+            JudoField(
+                key="salt_range",
+                index=1,
+                description=SensorEntityDescription(
+                    key="regeneration_salt_range",
+                    name="Regeneration Salt Range",
+                    device_class=SensorDeviceClass.DURATION,
+                    native_unit_of_measurement=UnitOfTime.DAYS,
+                    icon="mdi:clock-outline",
+                ),
+            ),
+        ),
+    ),
+    JudoRegister(
+        command="2500",
+        layout=struct.Struct("<BBH"),
+        interval=900,
+        priority=2,
+        fields=(
+            JudoField(
+                key="operating_hours",
+                convert=_operating_hours,
+                description=SensorEntityDescription(
+                    key="operating_hours",
+                    name="Operating Hours",
+                    device_class=SensorDeviceClass.DURATION,
+                    native_unit_of_measurement=UnitOfTime.HOURS,
+                    icon="mdi:clock",
+                ),
+            ),
+        ),
+    ),
+    JudoRegister(
+        command="5100",
+        layout=struct.Struct("<B"),
+        interval=3600,
+        priority=3,
+        fields=(
+            JudoField(
+                key="water_hardness",
+                description=SensorEntityDescription(
+                    key="water_hardness",
+                    name="Water Hardness",
+                    native_unit_of_measurement="°dH",
+                    icon="mdi:water-opacity",
+                ),
+            ),
+        ),
+    ),
+)
+
+IDENTITY_REGISTERS = tuple(register for register in REGISTERS if register.identity)
+POLLED_REGISTERS = tuple(register for register in REGISTERS if not register.identity)
+COMMAND_REGISTERS = {register.command: register for register in POLLED_REGISTERS}
+FIELD_REGISTERS = {
+    field.key: register for register in REGISTERS for field in register.fields
+}
@@ -0,0 +1,57 @@
+"""Per-register polling scheduler for Judo Connectivity Module."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .registers import JudoRegister
+
+
+class JudoPollScheduler:
+    """Decide which registers are due and when the next one is."""
+
+    def __init__(
+        self, registers: Iterable[JudoRegister], default_interval: float
+    ) -> None:
+        """Initialize the scheduler."""
+        self._registers = sorted(registers, key=lambda register: register.priority)
+        self.default_interval = default_interval
+        self._next_due: dict[str, float] = {}
+
+    def interval(self, register: JudoRegister) -> float:
+        """Return the effective refresh period of a register."""
+        return register.interval or self.default_interval
+
+    @property
+    def tick_interval(self) -> float:
+        """Return the shortest refresh period of any register."""
+        return min(self.interval(register) for register in self._registers)
+
+    def next_due(self, now: float) -> float:
+        """Return when the next register is due.
+
+        Registers that are already due, because their last poll failed, are
+        retried after the shortest refresh period.
+        """
+        next_due = min(
+            self._next_due.get(register.command, 0) for register in self._registers
+        )
+        return next_due if next_due > now else now + self.tick_interval
+
+    def due(self, now: float) -> list[JudoRegister]:
+        """Return the registers due at ``now``, highest priority first."""
+        return [
+            register
+            for register in self._registers
+            if self._next_due.get(register.command, 0) <= now
+        ]
+
+    def mark_polled(self, register: JudoRegister, now: float) -> None:
+        """Record a successful poll of ``register``."""
+        self._next_due[register.command] = now + self.interval(register)
+
+    def reset(self) -> None:
+        """Make every register due on the next refresh."""
+        self._next_due.clear()
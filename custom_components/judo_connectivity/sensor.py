@@ -1,18 +1,193 @@
 """Sensor entities for Judo Connectivity Module."""
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from operator import attrgetter
+import time
+
 from homeassistant.components.sensor import (
-    SensorEntity,
     SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfMass, UnitOfVolume, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfTime,
+    UnitOfVolume,
+    UnitOfVolumeFlowRate,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DEVICE_TYPES, DOMAIN
+from .const import DOMAIN, FLOW_RATE_WINDOW
 from .coordinator import JudoDataUpdateCoordinator
+from .entity import JudoEntity
+from .fleet import JudoFleet
+from .hub import JudoHub
+from .registers import REGISTERS
+
+
+@dataclass(frozen=True, kw_only=True)
+class JudoDerivedSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor derived from the readings of a register field."""
+
+    source: str | None  # Field the value is derived from, if any
+    value_fn: Callable[[JudoDataUpdateCoordinator, float], float | None]
+
+
+DERIVED_SENSORS: tuple[JudoDerivedSensorEntityDescription, ...] = (
+    JudoDerivedSensorEntityDescription(
+        key="water_flow_rate",
+        name="Water Flow Rate",
+        device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
+        icon="mdi:waves-arrow-right",
+        source="water_counter",
+        value_fn=lambda coordinator, now: coordinator.water_series.flow_rate(
+            now - FLOW_RATE_WINDOW
+        ),
+    ),
+    JudoDerivedSensorEntityDescription(
+        key="water_consumption_last_hour",
+        name="Water Consumption Last Hour",
+        device_class=SensorDeviceClass.WATER,
+        native_unit_of_measurement=UnitOfVolume.LITERS,
+        icon="mdi:water",
+        source="water_counter",
+        value_fn=lambda coordinator, now: coordinator.water_series.consumption(
+            now - 3600
+        ),
+    ),
+    JudoDerivedSensorEntityDescription(
+        key="water_consumption_last_day",
+        name="Water Consumption Last Day",
+        device_class=SensorDeviceClass.WATER,
+        native_unit_of_measurement=UnitOfVolume.LITERS,
+        icon="mdi:water",
+        source="water_counter",
+        value_fn=lambda coordinator, now: coordinator.water_series.consumption(
+            now - 86400
+        ),
+    ),
+    JudoDerivedSensorEntityDescription(
+        key="regeneration_salt_forecast_range",
+        name="Regeneration Salt Forecast Range",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.DAYS,
+        icon="mdi:chart-timeline-variant",
+        source="salt_stock",
+        value_fn=lambda coordinator, now: coordinator.salt_forecast.days_to_empty(),
+    ),
+    JudoDerivedSensorEntityDescription(
+        key="request_latency",
+        name="Request Latency",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:timer-outline",
+        source=None,
+        value_fn=lambda coordinator, now: (
+            None
+            if (latency := coordinator.client.mean_latency) is None
+            else latency * 1000
+        ),
+    ),
+    JudoDerivedSensorEntityDescription(
+        key="failed_requests",
+        name="Failed Requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:alert-circle-outline",
+        source=None,
+        value_fn=lambda coordinator, now: coordinator.client.failures,
+    ),
+    JudoDerivedSensorEntityDescription(
+        key="refresh_duration",
+        name="Refresh Duration",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:timer-sync-outline",
+        source=None,
+        value_fn=lambda coordinator, now: (
+            None
+            if (duration := coordinator.refresh_duration) is None
+            else duration * 1000
+        ),
+    ),
+    JudoDerivedSensorEntityDescription(
+        key="data_overdue",
+        name="Data Overdue",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:timer-alert-outline",
+        source=None,
+        value_fn=lambda coordinator, now: round(coordinator.overdue()),
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class JudoFleetSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor aggregating all modules of the instance."""
+
+    value_fn: Callable[[JudoFleet], float | None]
+
+
+FLEET_SENSORS: tuple[JudoFleetSensorEntityDescription, ...] = (
+    JudoFleetSensorEntityDescription(
+        key="fleet_total_water_volume",
+        name="Total Water Volume",
+        device_class=SensorDeviceClass.WATER,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfVolume.CUBIC_METERS,
+        icon="mdi:water",
+        value_fn=lambda fleet: fleet.water_volume,
+    ),
+    JudoFleetSensorEntityDescription(
+        key="fleet_lowest_salt_range",
+        name="Lowest Regeneration Salt Range",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.DAYS,
+        icon="mdi:clock-alert-outline",
+        value_fn=lambda fleet: fleet.salt_range_percentile(0),
+    ),
+    JudoFleetSensorEntityDescription(
+        key="fleet_salt_range_10th_percentile",
+        name="Regeneration Salt Range 10th Percentile",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.DAYS,
+        icon="mdi:clock-outline",
+        value_fn=lambda fleet: fleet.salt_range_percentile(10),
+    ),
+    JudoFleetSensorEntityDescription(
+        key="fleet_median_salt_range",
+        name="Median Regeneration Salt Range",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.DAYS,
+        icon="mdi:clock-outline",
+        value_fn=lambda fleet: fleet.salt_range_percentile(50),
+    ),
+    JudoFleetSensorEntityDescription(
+        key="fleet_salt_refills_needed",
+        name="Salt Refills Needed",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:shaker-outline",
+        value_fn=lambda fleet: fleet.refill_count,
+    ),
+)
 
 
 async def async_setup_entry(
@@ -22,170 +197,153 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensor platform."""
     coordinator: JudoDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = [
-        JudoDeviceTypeSensor(coordinator, entry),
-        JudoDeviceNumberSensor(coordinator, entry),
-        JudoSoftwareVersionSensor(coordinator, entry),
-        JudoOperatingHoursSensor(coordinator, entry),
-        JudoTotalWaterVolumeSensor(coordinator, entry),
-        JudoSaltRangeSensor(coordinator, entry),
-        JudoSaltStockSensor(coordinator, entry),
-        JudoWaterHardnessSensor(coordinator, entry),
-    ]
-    async_add_entities(entities)
-
-
-class JudoSensor(SensorEntity):
-    """Base class for Judo sensors."""
+    async_add_entities(
+        JudoSensor(coordinator, entry, field.key, field.description)
+        for register in REGISTERS
+        for field in register.fields
+        if field.description is not None
+    )
+    async_add_entities(
+        JudoDerivedSensor(coordinator, entry, description)
+        for description in DERIVED_SENSORS
+    )
+    hub = coordinator.hub
+    entry.async_on_unload(
+        hub.async_add_fleet_host(
+            entry.entry_id,
+            lambda: async_add_entities(
+                JudoFleetSensor(hub, description) for description in FLEET_SENSORS
+            ),
+        )
+    )
+
+
+class JudoSensor(JudoEntity, SensorEntity):
+    """Representation of a Judo sensor backed by a register field."""
 
     def __init__(
-        self, coordinator: JudoDataUpdateCoordinator, entry: ConfigEntry
+        self,
+        coordinator: JudoDataUpdateCoordinator,
+        entry: ConfigEntry,
+        data_key: str,
+        description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        self.coordinator = coordinator
-        self._entry = entry
-        self._attr_has_entity_name = True
-        self._attr_unique_id = (
-            f"{entry.unique_id}_{self._attr_name.lower().replace(' ', '_')}"
-        )
+        super().__init__(coordinator, entry)
+        self.entity_description = description
+        self._data_key = data_key
+        self._value = attrgetter(data_key)
+        self._attr_unique_id = f"{entry.unique_id}_{description.key}"
 
-    @property
-    def device_info(self) -> DeviceInfo | None:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.unique_id)},
-        )
+    def _data_changed(self) -> bool:
+        """Return if the last coordinator update changed the sensor's field."""
+        return self._data_key in self.coordinator.changed_fields
 
     @property
     def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
-
-
-class JudoDeviceTypeSensor(JudoSensor):
-    """Representation of the Device Type sensor."""
-
-    _attr_name = "Device Type"
-    _attr_icon = "mdi:water-pump"
+        """Return if the value is known and not stale."""
+        return self.coordinator.is_fresh(self._data_key)
 
     @property
-    def state(self) -> str:
-        """Return the state of the sensor."""
-        hex_value = self.coordinator.data["device_type"]
-        value = int(hex_value, 16)
-        return DEVICE_TYPES.get(value, "Unknown")
+    def native_value(self) -> str | int | float | None:
+        """Return the decoded value of the sensor."""
+        return self._value(self.coordinator.data)
 
 
-class JudoDeviceNumberSensor(JudoSensor):
-    """Representation of the Device Number sensor."""
+class JudoDerivedSensor(JudoEntity, SensorEntity):
+    """Representation of a Judo sensor derived from a field's readings."""
 
-    _attr_name = "Device Number"
-    _attr_icon = "mdi:numeric"
+    entity_description: JudoDerivedSensorEntityDescription
 
-    @property
-    def state(self) -> str:
-        """Return the state of the sensor."""
-        hex_value = self.coordinator.data["device_no"]
-        return str(int(hex_value, 16))
-
-
-class JudoSoftwareVersionSensor(JudoSensor):
-    """Representation of the Software Version sensor."""
-
-    _attr_name = "Software Version"
-    _attr_icon = "mdi:chip"
-
-    @property
-    def state(self) -> str:
-        """Return the state of the sensor."""
-        hex_value = self.coordinator.data["sw_version"]
-        bytes_value = bytes.fromhex(hex_value)
-        return f"{bytes_value[1]}.{bytes_value[2]:02d}"
-
-
-class JudoOperatingHoursSensor(JudoSensor):
-    """Representation of the Operating Hours sensor."""
-
-    _attr_name = "Operating Hours"
-    _attr_device_class = SensorDeviceClass.DURATION
-    _attr_native_unit_of_measurement = UnitOfTime.HOURS
-    _attr_icon = "mdi:clock"
+    def __init__(
+        self,
+        coordinator: JudoDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: JudoDerivedSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.unique_id}_{description.key}"
+        self._written_value: float | None = None  # As of the last update
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the value of the initial state."""
+        await super().async_added_to_hass()
+        self._written_value = self.native_value
+
+    def _data_changed(self) -> bool:
+        """Return if the derived value moved since the last update."""
+        value = self.native_value
+        if value == self._written_value:
+            return False
+        self._written_value = value
+        return True
 
     @property
-    def state(self) -> float:
-        """Return the state of the sensor."""
-        hex_value = self.coordinator.data["operating_hours"]
-        bytes_value = bytes.fromhex(hex_value)
-        minutes, hours, days = (
-            bytes_value[0],
-            bytes_value[1],
-            int.from_bytes(bytes_value[2:], "little"),
-        )
-        return round(days * 24 + hours + minutes / 60, 1)
-
-
-class JudoTotalWaterVolumeSensor(JudoSensor):
-    """Representation of the Total Water Volume sensor."""
-
-    _attr_name = "Total Water Volume"
-    _attr_device_class = SensorDeviceClass.WATER
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-    _attr_native_unit_of_measurement = UnitOfVolume.CUBIC_METERS
-    _attr_icon = "mdi:water"
+    def available(self) -> bool:
+        """Return if the source field is current enough to derive from."""
+        source = self.entity_description.source
+        if source is not None and not self.coordinator.is_fresh(source):
+            return False
+        return self.native_value is not None
 
     @property
-    def state(self) -> float:
-        """Return the state of the sensor."""
-        hex_value = self.coordinator.data["total_water_volume"]
-        reordered_hex = (
-            hex_value[6:8] + hex_value[4:6] + hex_value[2:4] + hex_value[0:2]
-        )
-        liters = int(reordered_hex, 16)
-        return liters / 1000  # Liters to m³
+    def native_value(self) -> float | None:
+        """Return the derived value."""
+        return self.entity_description.value_fn(self.coordinator, time.time())
 
 
-class JudoSaltRangeSensor(JudoSensor):
-    """Representation of the Regeneration Salt Range sensor."""
+class JudoFleetSensor(SensorEntity):
+    """Representation of an aggregate over all Judo modules of the instance.
 
-    _attr_name = "Regeneration Salt Range"
-    _attr_device_class = SensorDeviceClass.DURATION
-    _attr_native_unit_of_measurement = UnitOfTime.DAYS
-    _attr_icon = "mdi:clock-outline"
+    The sensors belong to a device of their own, whichever entry hosts them,
+    and only write state when their aggregate changes.
+    """
 
-    @property
-    def state(self) -> int:
-        """Return the state of the sensor."""
-        hex_value = self.coordinator.data["salt_range"]
-        bytes_value = bytes.fromhex(hex_value)
-        return int.from_bytes(bytes_value[2:], "little")
+    _attr_has_entity_name = True
+    _attr_should_poll = False
 
+    entity_description: JudoFleetSensorEntityDescription
 
-class JudoSaltStockSensor(JudoSensor):
-    """Representation of the Regeneration Salt Stock sensor."""
+    def __init__(
+        self, hub: JudoHub, description: JudoFleetSensorEntityDescription
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._hub = hub
+        self._attr_unique_id = f"{DOMAIN}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, "fleet")},
+            entry_type=DeviceEntryType.SERVICE,
+            manufacturer="Judo",
+            name="Judo Fleet",
+        )
+        self._written_value: float | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for changes of the fleet aggregates."""
+        await super().async_added_to_hass()
+        self._written_value = self.native_value
+        self.async_on_remove(
+            self._hub.async_add_fleet_listener(self._handle_fleet_update)
+        )
 
-    _attr_name = "Regeneration Salt Stock"
-    _attr_device_class = SensorDeviceClass.WEIGHT
-    _attr_native_unit_of_measurement = UnitOfMass.GRAMS
-    _attr_icon = "mdi:weight"
+    @callback
+    def _handle_fleet_update(self) -> None:
+        """Write state if the aggregate changed."""
+        value = self.native_value
+        if value == self._written_value:
+            return
+        self._written_value = value
+        self.async_write_ha_state()
 
     @property
-    def state(self) -> int:
-        """Return the state of the sensor."""
-        hex_value = self.coordinator.data["salt_stock"]
-        bytes_value = bytes.fromhex(hex_value)
-        return int.from_bytes(bytes_value[:2], "little")
-
-
-class JudoWaterHardnessSensor(JudoSensor):
-    """Representation of the Water Hardness sensor."""
-
-    _attr_name = "Water Hardness"
-    _attr_native_unit_of_measurement = "°dH"
-    _attr_icon = "mdi:water-opacity"
+    def available(self) -> bool:
+        """Return if any module contributes to the aggregate."""
+        return self.native_value is not None
 
     @property
-    def state(self) -> int:
-        """Return the state of the sensor."""
-        hex_value = self.coordinator.data["water_hardness"]
-        bytes_value = bytes.fromhex(hex_value)
-        return bytes_value[0]  # LSB
+    def native_value(self) -> float | None:
+        """Return the aggregate."""
+        return self.entity_description.value_fn(self._hub.fleet)
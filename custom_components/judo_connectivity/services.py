@@ -0,0 +1,56 @@
+"""Services for Judo Connectivity Module."""
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN
+from .statistics import async_import_water_statistics
+
+SERVICE_IMPORT_STATISTICS = "import_statistics"
+
+ATTR_MONTHS = "months"
+
+IMPORT_STATISTICS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_MONTHS, default=12): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=120)
+        ),
+    }
+)
+
+
+async def _async_import_statistics(call: ServiceCall) -> ServiceResponse:
+    """Import the water history of a device as long-term statistics."""
+    entry = call.hass.config_entries.async_get_entry(call.data[ATTR_CONFIG_ENTRY_ID])
+    if entry is None or entry.domain != DOMAIN:
+        raise ServiceValidationError("Unknown Judo config entry")
+    if entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(f"{entry.title} is not loaded")
+    imported = await async_import_water_statistics(
+        call.hass, entry.runtime_data, call.data[ATTR_MONTHS]
+    )
+    return {"imported_days": imported}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_STATISTICS,
+        _async_import_statistics,
+        schema=IMPORT_STATISTICS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,131 @@
+"""Water consumption time series for Judo Connectivity Module."""
+
+from array import array
+import base64
+import sys
+
+
+def _encode(samples: array) -> str:
+    """Encode an array as base64 of its little-endian bytes."""
+    if sys.byteorder == "big":
+        samples = array(samples.typecode, samples)
+        samples.byteswap()
+    return base64.b64encode(samples.tobytes()).decode()
+
+
+def _decode(typecode: str, encoded: str) -> array:
+    """Decode an array encoded by ``_encode``."""
+    samples = array(typecode)
+    samples.frombytes(base64.b64decode(encoded))
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples
+
+
+class JudoWaterSeries:
+    """Ring buffer of the liters drawn between readings of the water counter.
+
+    Samples are kept as fixed-width integers in two preallocated arrays, the
+    reading time in seconds and the liters drawn since the previous sample,
+    so memory stays constant however long the integration runs. Consecutive
+    idle samples are merged, which lets the buffer span long quiet periods.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty series holding up to ``capacity`` samples."""
+        self._times = array("I", bytes(4 * capacity))
+        self._deltas = array("I", bytes(4 * capacity))
+        self._capacity = capacity
+        self._end = 0  # Index after the newest sample
+        self._size = 0
+        self._counter: int | None = None
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return self._size
+
+    def add(self, timestamp: float, counter: int) -> tuple[int, int] | None:
+        """Record a reading of the cumulative water counter, in liters.
+
+        Returns the liters drawn and the seconds elapsed since the previous
+        reading, or None when there is nothing to compare the reading to.
+        """
+        timestamp = int(timestamp)
+        if self._size:
+            previous = self._times[self._end - 1]
+            if timestamp <= previous:
+                return None
+        if self._counter is None or counter < self._counter:
+            # No reading yet or the counter was reset, start from this one
+            sample = None
+            delta = 0
+        else:
+            delta = counter - self._counter
+            sample = delta, timestamp - previous
+        self._counter = counter
+        if self._size > 1 and delta == 0 and self._deltas[self._end - 1] == 0:
+            self._times[self._end - 1] = timestamp
+            return sample
+        self._times[self._end] = timestamp
+        self._deltas[self._end] = delta
+        self._end = (self._end + 1) % self._capacity
+        self._size = min(self._size + 1, self._capacity)
+        return sample
+
+    def _newest_first(self):
+        """Yield the ring indexes from the newest to the oldest sample."""
+        for offset in range(1, self._size + 1):
+            yield (self._end - offset) % self._capacity
+
+    def consumption(self, since: float) -> int | None:
+        """Return the liters drawn in the samples taken after ``since``.
+
+        Returns None when the series does not reach back to ``since``, since
+        the water drawn before its oldest sample is not known.
+        """
+        if self._size < 2:
+            return None
+        total = 0
+        for index in self._newest_first():
+            if self._times[index] <= since:
+                return total
+            total += self._deltas[index]
+        return None
+
+    def flow_rate(self, since: float) -> float | None:
+        """Return the average flow in liters per minute after ``since``.
+
+        The oldest sample only marks where the series starts. When no other
+        sample was taken after ``since``, the rate between the two newest
+        samples is returned instead.
+        """
+        if self._size < 2:
+            return None
+        indexes = self._newest_first()
+        end = next(indexes)
+        total = self._deltas[end]
+        for count, index in enumerate(indexes, 2):
+            if self._times[index] <= since or count == self._size:
+                start = index
+                break
+            total += self._deltas[index]
+        return round(total * 60 / (self._times[end] - self._times[start]), 2)
+
+    def as_dict(self) -> dict[str, any]:
+        """Return the series in a form that can be stored as JSON."""
+        indexes = list(reversed(list(self._newest_first())))
+        return {
+            "counter": self._counter,
+            "times": _encode(array("I", (self._times[i] for i in indexes))),
+            "deltas": _encode(array("I", (self._deltas[i] for i in indexes))),
+        }
+
+    def restore(self, stored: dict[str, any]) -> None:
+        """Replace the samples with a series returned by ``as_dict``."""
+        times = _decode("I", stored["times"])[-self._capacity :]
+        deltas = _decode("I", stored["deltas"])[-self._capacity :]
+        self._size = len(times)
+        self._end = self._size % self._capacity
+        self._times[: self._size] = times
+        self._deltas[: self._size] = deltas
+        self._counter = stored["counter"]
@@ -11,7 +11,7 @@ git pull origin main
 mkdir -p "$DEST_DIR"
 
 # Sync the files from source to destination
-rsync -av --delete "$SOURCE_DIR" "$DEST_DIR"
+rsync -av --delete "$SOURCE_DIR/" "$DEST_DIR"
 
 # Navigate to the repo directory to stage and commit changes
 cd /workspaces/repos/judo-connectivity
@@ -0,0 +1,12 @@
+"""Make the integration's Home Assistant independent modules importable.
+
+The package itself imports Home Assistant, so the modules that do not are
+tested on their own, imported straight from the integration directory.
+"""
+
+from pathlib import Path
+import sys
+
+sys.path.insert(
+    0, str(Path(__file__).parent.parent / "custom_components" / "judo_connectivity")
+)
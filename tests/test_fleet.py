@@ -0,0 +1,68 @@
+"""Tests of the fleet aggregates."""
+
+import random
+
+from fleet import JudoFleet
+
+
+def test_water_total_counts_growth_since_joining() -> None:
+    """Modules joining, leaving and resetting their counter move no water."""
+    fleet = JudoFleet(14)
+    assert fleet.water_volume is None
+    assert fleet.update_water("a", 50000)
+    assert fleet.water_volume == 0
+    assert not fleet.update_water("a", 50000)
+    assert fleet.update_water("a", 50100)
+    assert fleet.update_water("b", 80000)
+    assert fleet.water_volume == 0.1
+    assert fleet.update_water("b", 80400)
+    assert fleet.water_volume == 0.5
+    fleet.remove("a")
+    assert fleet.water_volume == 0.5
+    assert not fleet.update_water("b", 100)  # Counter reset
+    assert fleet.update_water("b", 300)
+    assert fleet.water_volume == 0.7
+
+
+def test_salt_aggregates_match_a_rescan() -> None:
+    """Incremental salt aggregates equal those computed from scratch."""
+    rng = random.Random(1)
+    fleet = JudoFleet(14)
+    salt_ranges = {}
+    for _ in range(2000):
+        module = str(rng.randrange(30))
+        salt_range = rng.choice([None, rng.randrange(60)])
+        fleet.update_salt_range(module, salt_range)
+        salt_ranges[module] = salt_range
+    ranges = sorted(value for value in salt_ranges.values() if value is not None)
+    assert fleet.salt_range_percentile(0) == ranges[0]
+    assert fleet.salt_range_percentile(50) == ranges[(len(ranges) + 1) // 2 - 1]
+    assert fleet.salt_range_percentile(100) == ranges[-1]
+    assert fleet.refill_count == sum(value <= 14 for value in ranges)
+    for module in salt_ranges:
+        fleet.remove(module)
+    assert fleet.salt_range_percentile(50) is None
+    assert fleet.refill_count == 0
+
+
+def test_total_waits_for_expected_modules() -> None:
+    """The total is unknown until every expected module has reported."""
+    fleet = JudoFleet(14)
+    fleet.expect("a")
+    fleet.expect("b")
+    fleet.update_water("a", 100)
+    assert fleet.water_volume is None
+    assert fleet.update_water("b", 0)
+    assert fleet.water_volume == 0
+
+
+def test_total_stops_waiting_for_a_module_that_is_not_loaded() -> None:
+    """A module no longer awaited does not keep the total unknown."""
+    fleet = JudoFleet(14)
+    fleet.expect("a")
+    fleet.expect("b")
+    fleet.update_water("a", 100)
+    assert fleet.unexpect("b")
+    assert fleet.water_volume == 0
+    assert not fleet.unexpect("b")
+    assert not fleet.unexpect("a")
@@ -0,0 +1,72 @@
+"""Tests of the salt forecast at different poll intervals."""
+
+from forecast import JudoSaltForecast
+
+START = 1_700_000_000
+DAY = 86400
+
+
+def _run(poll: int, days: float) -> tuple[JudoSaltForecast, list[float]]:
+    """Draw 200 L a day and regenerate with 600 g every 3 days, 1 g per liter.
+
+    Returns the forecast and the days to empty it gave after a 20 day warmup.
+    """
+    forecast = JudoSaltForecast(5)
+    stock = 600 * 51
+    forecasts = []
+    for elapsed in range(0, int(days * DAY), poll):
+        water = 10000 + 200 * elapsed // DAY
+        forecast.add(START + elapsed, water, stock - 600 * (elapsed // (3 * DAY)))
+        if elapsed > 20 * DAY:
+            forecasts.append(forecast.days_to_empty())
+    return forecast, forecasts
+
+
+def test_rates_do_not_depend_on_the_poll_interval() -> None:
+    """The rates match the simulated use and the forecast runs down smoothly."""
+    for poll in (60, 300, 3600):
+        forecast, forecasts = _run(poll, 60)
+        assert abs(forecast.grams_per_liter - 1.0) < 0.01
+        assert abs(forecast.liters_per_day - 200) < 2
+        steps = [abs(a - b) for a, b in zip(forecasts, forecasts[1:], strict=False)]
+        assert max(steps) < 1.5
+
+
+def test_refill_read_keeps_the_rates() -> None:
+    """A stock that was read to rise only extends the forecast."""
+    forecast, _ = _run(300, 30)
+    grams_per_liter = forecast.grams_per_liter
+    days = forecast.days_to_empty()
+    timestamp, water, salt = forecast.as_dict()["last"]
+    forecast.add(timestamp + 300, water + 1, salt + 20000)
+    assert forecast.grams_per_liter == grams_per_liter
+    assert forecast.days_to_empty() > days + 90
+
+
+def test_written_stock_is_not_salt_used() -> None:
+    """A written stock below the last reading does not count as a regeneration."""
+    forecast, _ = _run(300, 30)
+    grams_per_liter = forecast.grams_per_liter
+    timestamp, water, _ = forecast.as_dict()["last"]
+    forecast.rebase(5000)
+    forecast.add(timestamp + 300, water + 1, 5000)
+    assert forecast.grams_per_liter == grams_per_liter
+    assert 20 < forecast.days_to_empty() <= 25
+
+
+def test_counter_reset_starts_over() -> None:
+    """A water counter that went back starts the rates over."""
+    forecast, _ = _run(300, 30)
+    timestamp, _, salt = forecast.as_dict()["last"]
+    forecast.add(timestamp + 300, 0, salt)
+    assert forecast.grams_per_liter is None
+    assert forecast.days_to_empty() is None
+
+
+def test_restore() -> None:
+    """A restored forecast gives the same result."""
+    forecast, _ = _run(300, 30)
+    restored = JudoSaltForecast(5)
+    restored.restore(forecast.as_dict())
+    assert restored.as_dict() == forecast.as_dict()
+    assert restored.days_to_empty() == forecast.days_to_empty()
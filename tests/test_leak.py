@@ -0,0 +1,77 @@
+"""Tests of the leak detector fed from a water series, as the coordinator does."""
+
+from leak import LEAK_BURST, LEAK_CONTINUOUS_FLOW, JudoLeakDetector
+from timeseries import JudoWaterSeries
+
+START = 1_700_000_000
+
+
+def _run(poll: int, hours: float, liters_at) -> tuple[list, JudoLeakDetector]:
+    """Feed counter readings every ``poll`` seconds and collect the alerts."""
+    series = JudoWaterSeries(4096)
+    detector = JudoLeakDetector(7200, 1800, 4.0, 30)
+    alerts = []
+    for elapsed in range(0, int(hours * 3600) + 1, poll):
+        sample = series.add(START + elapsed, int(liters_at(elapsed)))
+        if sample is not None and (alert := detector.add(START + elapsed, *sample)):
+            alerts.append((elapsed, alert))
+    return alerts, detector
+
+
+def test_slow_leak_is_continuous_flow() -> None:
+    """A 0.5 L/min leak is flagged after two hours, whatever the poll interval."""
+    for poll in (10, 60, 300):
+        alerts, detector = _run(poll, 6, lambda elapsed: elapsed / 120)
+        assert detector.alert == LEAK_CONTINUOUS_FLOW
+        assert alerts[0][1] == LEAK_CONTINUOUS_FLOW
+        assert 7200 <= alerts[0][0] <= 7200 + 2 * poll + 240
+
+
+def test_normal_use_raises_no_alert() -> None:
+    """Draws separated by idle spans longer than the pause raise nothing."""
+
+    def liters_at(elapsed: int) -> int:
+        return elapsed // 10800 * 50 + elapsed // 2400 * 10
+
+    for poll in (10, 60, 300):
+        alerts, detector = _run(poll, 12, liters_at)
+        assert alerts == []
+        assert detector.alert is None
+
+
+def test_gap_between_readings_is_a_pause() -> None:
+    """Water drawn over a long gap between readings is not continuous flow."""
+    detector = JudoLeakDetector(7200, 1800, 4.0, 30)
+    for elapsed in range(600, 7200, 600):
+        detector.add(START + elapsed, 5, 600)
+    assert detector.add(START + 18000, 50, 10800) is None
+    assert detector.alert is None
+
+
+def test_alerts_clear_and_burst() -> None:
+    """An alert clears after a pause and a rate far above the mean is a burst."""
+    detector = JudoLeakDetector(3600, 1800, 4.0, 5)
+    timestamp = START
+    for index in range(13):
+        timestamp += 300
+        detector.add(timestamp, 10 + index % 3, 300)
+    assert detector.alert == LEAK_CONTINUOUS_FLOW
+    timestamp += 1800
+    assert detector.add(timestamp, 0, 1800) is None
+    assert detector.alert is None
+    timestamp += 300
+    assert detector.add(timestamp, 500, 300) == LEAK_BURST
+    timestamp += 300
+    assert detector.add(timestamp, 11, 300) is None
+    assert detector.alert is None
+
+
+def test_restore() -> None:
+    """A restored detector carries on from the stored flow and statistics."""
+    detector = JudoLeakDetector(7200, 1800, 4.0, 30)
+    for elapsed in range(60, 7200, 60):
+        detector.add(START + elapsed, 1, 60)
+    restored = JudoLeakDetector(7200, 1800, 4.0, 30)
+    restored.restore(detector.as_dict())
+    assert restored.as_dict() == detector.as_dict()
+    assert restored.add(START + 7260, 1, 60) == LEAK_CONTINUOUS_FLOW
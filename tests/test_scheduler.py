@@ -0,0 +1,68 @@
+"""Tests of the per-register polling scheduler."""
+
+from collections import defaultdict
+from dataclasses import dataclass
+
+from scheduler import JudoPollScheduler
+
+
+@dataclass(frozen=True)
+class Register:
+    """The parts of a register the scheduler uses."""
+
+    command: str
+    interval: int | None = None
+    priority: int = 0
+
+
+# The polled registers of the integration
+REGISTERS = (
+    Register("2900", None, 0),
+    Register("5600", None, 1),
+    Register("2500", 900, 2),
+    Register("5100", 3600, 3),
+)
+
+
+def _poll_periods(default_interval: int) -> dict[str, set[float]]:
+    """Refresh whenever the next register is due and return the poll periods."""
+    scheduler = JudoPollScheduler(REGISTERS, default_interval)
+    polls = defaultdict(list)
+    now = 0.0
+    while now < 20000:
+        for register in scheduler.due(now):
+            scheduler.mark_polled(register, now)
+            polls[register.command].append(now)
+        now = scheduler.next_due(now)
+    return {
+        command: {b - a for a, b in zip(times, times[1:], strict=False)}
+        for command, times in polls.items()
+    }
+
+
+def test_every_register_keeps_its_interval() -> None:
+    """No interval is rounded up to a multiple of the shortest one."""
+    assert _poll_periods(1000) == {
+        "2900": {1000},
+        "5600": {1000},
+        "2500": {900},
+        "5100": {3600},
+    }
+    assert _poll_periods(600)["2500"] == {900}
+
+
+def test_due_registers_in_priority_order() -> None:
+    """Due registers come highest priority first, failed ones stay due."""
+    scheduler = JudoPollScheduler(reversed(REGISTERS), 300)
+    assert [register.command for register in scheduler.due(0)] == [
+        "2900",
+        "5600",
+        "2500",
+        "5100",
+    ]
+    for register in REGISTERS[1:]:
+        scheduler.mark_polled(register, 0)
+    assert [register.command for register in scheduler.due(1)] == ["2900"]
+    assert scheduler.next_due(1) == 1 + 300
+    scheduler.reset()
+    assert len(scheduler.due(1)) == len(REGISTERS)